@@ -4,24 +4,192 @@ Mixbot Analytics Dashboard
 Simple dashboard to view user analytics data
 """
 
+import os
+import mmap
+import threading
 import streamlit as st
+import numpy as np
 import pandas as pd
-import json
+import pyarrow as pa
+import pyarrow.json as pa_json
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
 
-def load_analytics_data():
-    """Load analytics data from JSONL file"""
+ANALYTICS_FILE = "user_analytics.jsonl"
+
+# Fields the app writes to the analytics log. Parsing against an explicit schema
+# lets pyarrow write straight into narrow typed columns and skip anything else in
+# a record (such as fields from older app versions); the download button serves
+# the log file itself, so nothing is lost from the export.
+# ``details`` subfields end up as ``d_``-prefixed columns.
+ANALYTICS_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('us')),
+    ('action', pa.string()),
+    ('session_id', pa.string()),
+    ('page', pa.string()),
+    ('details', pa.struct([
+        ('daw', pa.string()),
+        ('genre', pa.string()),
+        ('file_name', pa.string()),
+        ('file_type', pa.string()),
+        ('file_size', pa.int64()),
+        ('file_size_mb', pa.float64()),
+        ('analysis_time_seconds', pa.float32()),
+        ('error_type', pa.string()),
+        ('user_context', pa.string()),
+    ])),
+])
+ANALYTICS_PARSE_OPTIONS = pa_json.ParseOptions(
+    explicit_schema=ANALYTICS_SCHEMA,
+    unexpected_field_behavior="ignore"
+)
+
+# Analysis times are binned server-side so the chart payload doesn't grow with history
+HISTOGRAM_BINS = 50
+
+# Rows per page in the "Raw Analytics Data" expander
+RAW_PAGE_SIZE = 500
+
+def _mtime():
+    """Cache key for the analytics file: (mtime_ns, size), or None if it doesn't exist yet"""
     try:
-        data = []
-        with open("user_analytics.jsonl", "r") as f:
-            for line in f:
-                if line.strip():
-                    data.append(json.loads(line))
-        return data
+        stat = os.stat(ANALYTICS_FILE)
     except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource
+def _analytics_tail():
+    """Tables parsed so far from the append-only analytics log, shared across sessions"""
+    return {"offset": 0, "tables": [], "lock": threading.Lock()}
+
+def _parse_records(chunk):
+    """Parse a buffer of complete JSON lines against ``ANALYTICS_SCHEMA``"""
+    return pa_json.read_json(pa.BufferReader(chunk), parse_options=ANALYTICS_PARSE_OPTIONS)
+
+def _parse_lines(lines):
+    """Parse ``lines`` against ``ANALYTICS_SCHEMA``, dropping each line it rejects
+
+    A run of lines that fails is split in half until the offending lines are
+    isolated, so the lines around them are still parsed in bulk.
+    """
+    if not lines:
         return []
+    try:
+        return [_parse_records(b"\n".join(lines) + b"\n")]
+    except pa.ArrowInvalid:
+        if len(lines) == 1:
+            return []
+    mid = len(lines) // 2
+    return _parse_lines(lines[:mid]) + _parse_lines(lines[mid:])
+
+def _read_new_rows(tail):
+    """Parse only the records appended since the last read into ``tail["tables"]``"""
+    with open(ANALYTICS_FILE, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < tail["offset"]:
+            # File shrank (truncated or rotated) - start over
+            tail["offset"] = 0
+            tail["tables"] = []
+        if size == tail["offset"]:
+            return
+        
+        # Map the file and copy the new tail out in one go rather than through buffered reads
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            # Only consume complete lines; a record still being written is picked up next time
+            end = mm.rfind(b"\n", tail["offset"]) + 1
+            if not end:
+                return
+            chunk = mm[tail["offset"]:end]
+    
+    if chunk.strip():
+        try:
+            tail["tables"].append(_parse_records(chunk))
+        except pa.ArrowInvalid:
+            # A torn or non-conforming record somewhere in the chunk - keep the
+            # lines around it. The offset still moves past the dropped lines
+            tail["tables"].extend(
+                _parse_lines([line for line in chunk.split(b"\n") if line.strip()])
+            )
+    tail["offset"] = end
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def load_analytics_data(mtime):
+    """Load analytics data from JSONL file into a DataFrame
+
+    ``mtime`` is only the cache key - pass ``_mtime()`` so the file is
+    re-parsed whenever it changes and served from cache otherwise. Only
+    the newly appended tail of the file is parsed on each change, and only
+    the frame for the latest ``mtime`` is kept.
+    """
+    if mtime is None:
+        return pd.DataFrame()
+    
+    tail = _analytics_tail()
+    with tail["lock"]:
+        try:
+            _read_new_rows(tail)
+        except FileNotFoundError:
+            return pd.DataFrame()
+        tables = list(tail["tables"])
+    
+    if not tables:
+        return pd.DataFrame()
+    
+    table = pa.concat_tables(tables).flatten()
+    table = table.rename_columns([name.replace('details.', 'd_') for name in table.column_names])
+    # Low-cardinality strings (action, session_id, DAW, genre, file type) come out as categoricals
+    return table.to_pandas(strings_to_categorical=True)
+
+def _label_counts(labels):
+    """value_counts() of a categorical details column, counting missing labels as 'Unknown'"""
+    if labels.hasnans:
+        if 'Unknown' not in labels.cat.categories:
+            labels = labels.cat.add_categories('Unknown')
+        labels = labels.fillna('Unknown')
+    counts = labels.value_counts()
+    # Categorical value_counts() also reports categories that only occur in other actions' rows
+    return counts[counts > 0]
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def overview_metrics(mtime):
+    """Overview row (sessions, actions, uploads, analyses) computed once per file change"""
+    df = load_analytics_data(mtime)
+    action_counts = df['action'].value_counts()
+    return (
+        df['session_id'].nunique(),
+        len(df),
+        int(action_counts.get('file_upload', 0)),
+        int(action_counts.get('analysis_complete', 0)),
+    )
+
+def _read_log_bytes():
+    """The analytics log file as written, for the download button"""
+    with open(ANALYTICS_FILE, "rb") as f:
+        return f.read()
+
+@st.fragment
+def raw_data_panel(df):
+    """Paginated raw data view; paging reruns only this fragment, not the charts above"""
+    with st.expander("📋 Raw Analytics Data"):
+        # Only ship one page of rows to the browser; the full log is available as a download
+        pages = max(1, -(-len(df) // RAW_PAGE_SIZE))
+        page = st.number_input("Page", min_value=1, max_value=pages, value=pages)
+        start = (page - 1) * RAW_PAGE_SIZE
+        page_rows = df.iloc[start:start + RAW_PAGE_SIZE]
+        st.caption(f"Rows {start + 1}-{start + len(page_rows)} of {len(df)}")
+        st.dataframe(page_rows)
+        # Read only when clicked, and served as written rather than as the
+        # parsed columns, so every field of every record is in the export
+        st.download_button(
+            label="📥 Download Full Log (.jsonl)",
+            data=_read_log_bytes,
+            file_name="mixbot_analytics.jsonl",
+            mime="application/jsonl"
+        )
 
 def create_analytics_dashboard():
     """Create the analytics dashboard"""
@@ -31,34 +199,36 @@ def create_analytics_dashboard():
     st.markdown("---")
     
     # Load data
-    data = load_analytics_data()
+    mtime = _mtime()
+    df = load_analytics_data(mtime)
     
-    if not data:
+    if df.empty:
         st.warning("No analytics data found. Start using the app to generate data!")
         return
     
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
     # Filter for last 30 days
     thirty_days_ago = datetime.now() - timedelta(days=30)
     df_recent = df[df['timestamp'] > thirty_days_ago]
     
+    # Partition by action once instead of re-scanning the frame for every panel
+    by_action = dict(list(df.groupby('action', sort=False, observed=True)))
+    no_rows = df.iloc[:0]
+    
     # Overview metrics
+    total_sessions, total_actions, file_uploads, analyses_completed = overview_metrics(mtime)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Sessions", len(df['session_id'].unique()))
+        st.metric("Total Sessions", total_sessions)
     
     with col2:
-        st.metric("Total Actions", len(df))
+        st.metric("Total Actions", total_actions)
     
     with col3:
-        st.metric("File Uploads", len(df[df['action'] == 'file_upload']))
+        st.metric("File Uploads", file_uploads)
     
     with col4:
-        st.metric("Analyses Completed", len(df[df['action'] == 'analysis_complete']))
+        st.metric("Analyses Completed", analyses_completed)
     
     st.markdown("---")
     
@@ -67,17 +237,21 @@ def create_analytics_dashboard():
     
     with col1:
         st.subheader("📈 Actions Over Time")
-        daily_actions = df_recent.groupby(df_recent['timestamp'].dt.date)['action'].count().reset_index()
-        daily_actions.columns = ['date', 'count']
+        # Histogram of whole days since the start of the window, in one pass over the datetime64 array
+        first_day = np.datetime64(thirty_days_ago, 'D')
+        day_index = (df_recent['timestamp'].to_numpy() - first_day) // np.timedelta64(1, 'D')
+        daily_counts = np.bincount(day_index, minlength=31)
+        days = first_day + np.arange(daily_counts.size)
         
-        fig = px.line(daily_actions, x='date', y='count', title="Daily User Actions")
+        fig = go.Figure(go.Scattergl(x=days, y=daily_counts, mode='lines'))
+        fig.update_layout(title="Daily User Actions", xaxis_title="date", yaxis_title="count")
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🎛️ DAW Usage")
-        daw_data = df[df['action'] == 'daw_selection']
+        daw_data = by_action.get('daw_selection', no_rows)
         if not daw_data.empty:
-            daw_counts = daw_data['details'].apply(lambda x: x.get('daw', 'Unknown') if x else 'Unknown').value_counts()
+            daw_counts = _label_counts(daw_data['d_daw'])
             fig = px.pie(values=daw_counts.values, names=daw_counts.index, title="Most Popular DAWs")
             st.plotly_chart(fig, use_container_width=True)
         else:
@@ -85,9 +259,9 @@ def create_analytics_dashboard():
     
     # Genre analysis
     st.subheader("🎵 Genre Distribution")
-    genre_data = df[df['action'] == 'genre_detection']
+    genre_data = by_action.get('genre_detection', no_rows)
     if not genre_data.empty:
-        genre_counts = genre_data['details'].apply(lambda x: x.get('genre', 'Unknown') if x else 'Unknown').value_counts()
+        genre_counts = _label_counts(genre_data['d_genre'])
         fig = px.bar(x=genre_counts.index, y=genre_counts.values, title="Detected Genres")
         st.plotly_chart(fig, use_container_width=True)
     else:
@@ -95,9 +269,9 @@ def create_analytics_dashboard():
     
     # File type analysis
     st.subheader("📁 File Types")
-    file_data = df[df['action'] == 'file_upload']
+    file_data = by_action.get('file_upload', no_rows)
     if not file_data.empty:
-        file_types = file_data['details'].apply(lambda x: x.get('file_type', 'Unknown') if x else 'Unknown').value_counts()
+        file_types = _label_counts(file_data['d_file_type'])
         fig = px.pie(values=file_types.values, names=file_types.index, title="Uploaded File Types")
         st.plotly_chart(fig, use_container_width=True)
     else:
@@ -105,20 +279,21 @@ def create_analytics_dashboard():
     
     # Analysis performance
     st.subheader("⚡ Analysis Performance")
-    analysis_data = df[df['action'] == 'analysis_complete']
+    analysis_data = by_action.get('analysis_complete', no_rows)
     if not analysis_data.empty:
-        analysis_times = [d.get('analysis_time_seconds', 0) for d in analysis_data['details'] if d]
-        if analysis_times:
-            avg_time = sum(analysis_times) / len(analysis_times)
+        analysis_times = analysis_data['d_analysis_time_seconds'].dropna().to_numpy(dtype=np.float32)
+        if analysis_times.size:
+            avg_time = float(analysis_times.mean())
             st.metric("Average Analysis Time", f"{avg_time:.2f} seconds")
             
-            fig = px.histogram(x=analysis_times, title="Analysis Time Distribution", 
-                             labels={'x': 'Time (seconds)', 'y': 'Count'})
+            counts, edges = np.histogram(analysis_times, bins=HISTOGRAM_BINS)
+            fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, title="Analysis Time Distribution", 
+                         labels={'x': 'Time (seconds)', 'y': 'Count'})
+            fig.update_layout(bargap=0)
             st.plotly_chart(fig, use_container_width=True)
     
     # Raw data
-    with st.expander("📋 Raw Analytics Data"):
-        st.dataframe(df)
+    raw_data_panel(df)
 
 if __name__ == "__main__":
     create_analytics_dashboard() 
\ No newline at end of file
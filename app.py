@@ -1,35 +1,198 @@
 import streamlit as st
 import os
+import shutil
+import hashlib
 import tempfile
-import io
 from datetime import datetime
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from audio_analyzer import analyze_audio, generate_mix_feedback
-import numpy as np
-import librosa
+from functools import partial
+from audio_analyzer import analyze_audio
+from mix_feedback import (
+    get_daw_plugins,
+    analyze_genre_characteristics,
+    energy_assessment,
+    EQ_ADVICE_BY_GENRE,
+    GENERAL_EQ_ADVICE,
+    COMP_ADVICE_BY_GENRE,
+    GENERAL_COMP_ADVICE
+)
 import soundfile as sf
+import requests
+import re
 import time
 import json
+import atexit
+import queue
+import threading
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+ANALYTICS_LOG = "user_analytics.jsonl"
+ERROR_LOG = "error_log.jsonl"
+
+# Fallback encoder, built once and matching orjson's compact, non-ASCII-escaping output
+_json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+def _dumps(record):
+    """Serialize one analytics record to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    return _json_encode(record).encode()
+
+def _iso_timestamp(ns):
+    """Local ISO-8601 time for a ``time.time_ns()`` stamp, same format as datetime.now().isoformat()"""
+    seconds, ns = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000).isoformat()
+
+def _write_all(fd, data):
+    """os.write() until all of ``data`` is written (regular files rarely need a second call)"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+class _AnalyticsSink:
+    """Writes analytics and error records from a background thread
+
+    ``emit`` only enqueues the record, so no disk I/O happens on the script
+    thread. Records flagged ``also_error_log`` are written in full to the
+    error log and as a short reference to the analytics log; everything else
+    goes to the analytics log only. A single daemon thread drains the queue
+    in batches of up to BATCH_SIZE records and writes each batch to the log
+    files in one write() call per file, encoding into per-file buffers that
+    are reused from batch to batch.
+    """
+    BATCH_SIZE = 256
+    FLUSH_INTERVAL = 2.0
+    # Buffers that grew past this during a burst are dropped instead of kept around
+    BUFFER_SHRINK_SIZE = 128 * 1024
+    
+    def __init__(self):
+        # O_APPEND makes every write() land at the current end of file, so batches
+        # from other server processes appending to the same log don't overwrite each other
+        self.fds = {
+            path: os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            for path in (ANALYTICS_LOG, ERROR_LOG)
+        }
+        self.buffers = {path: bytearray() for path in self.fds}
+        self.queue = queue.Queue(maxsize=10_000)
+        self.thread = threading.Thread(target=self._drain, name="analytics-sink", daemon=True)
+        self.thread.start()
+    
+    def emit(self, record, also_error_log=False):
+        """Queue one analytics record"""
+        try:
+            self.queue.put_nowait((record, also_error_log))
+        except queue.Full:
+            pass  # Drop the event rather than stall the UI
+    
+    def _drain(self):
+        while True:
+            try:
+                batch = [self.queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in batch
+            self._write([item for item in batch if item is not None])
+            if stop:
+                return
+    
+    def _write(self, batch):
+        for record, also_error_log in batch:
+            try:
+                record["timestamp"] = _iso_timestamp(record["timestamp"])
+                if also_error_log:
+                    self.buffers[ERROR_LOG] += _dumps(record)
+                    self.buffers[ERROR_LOG] += b"\n"
+                    # The main analytics only gets a compact reference; the full
+                    # record is matched in the error log by timestamp and session
+                    record = {
+                        "timestamp": record["timestamp"],
+                        "action": "error",
+                        "details": {"error_type": record["error_type"], "user_context": record["user_context"]},
+                        "session_id": record["session_id"],
+                        "page": record["page"]
+                    }
+                self.buffers[ANALYTICS_LOG] += _dumps(record)
+                self.buffers[ANALYTICS_LOG] += b"\n"
+            except (TypeError, ValueError, KeyError):
+                pass  # Unserializable or malformed record - skip it like the old inline writer did
+        for path, fd in self.fds.items():
+            buffer = self.buffers[path]
+            if not buffer:
+                continue
+            try:
+                _write_all(fd, buffer)
+            except OSError:
+                pass  # Disk full or similar - drop this batch, keep the thread alive
+            if len(buffer) > self.BUFFER_SHRINK_SIZE:
+                self.buffers[path] = bytearray()
+            else:
+                buffer.clear()
+    
+    def close(self):
+        """Drain what is queued, then close both logs (registered with atexit)"""
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+        for fd in self.fds.values():
+            os.close(fd)
+
+@st.cache_resource
+def _analytics_sink():
+    """One sink per server process, shared by every session and rerun"""
+    sink = _AnalyticsSink()
+    atexit.register(sink.close)
+    return sink
 
 # Analytics functions
+def _emit_event(action, fields, also_error_log=False):
+    """Stamp a record with the common analytics fields and queue it, returning the record
+
+    The timestamp is taken as integer ``time.time_ns()`` here and only
+    formatted as ISO-8601 by the sink's drain thread, off the script thread.
+    """
+    record = {
+        "timestamp": time.time_ns(),
+        "action": action,
+        **fields,
+        "session_id": st.session_state.get("session_id", "unknown"),
+        "page": "mixbot_main"
+    }
+    _analytics_sink().emit(record, also_error_log)
+    return record
+
+# Identical consecutive actions within this window are logged once
+DEDUP_WINDOW_NS = 500_000_000
+# Every rerun counts as a page view; log the first of each session and then one in this many
+PAGE_VIEW_SAMPLE_EVERY = 10
+
+def _skip_event(action, details):
+    """Whether ``action`` should be dropped as an unsampled page view or a quick repeat"""
+    if action == "page_view":
+        views = st.session_state.get("_page_views", 0)
+        st.session_state._page_views = views + 1
+        if views % PAGE_VIEW_SAMPLE_EVERY:
+            return True
+    
+    now = time.monotonic_ns()
+    last_events = st.session_state.setdefault("_last_events", {})
+    last = last_events.get(action)
+    last_events[action] = (now, details)
+    return last is not None and now - last[0] < DEDUP_WINDOW_NS and last[1] == details
+
 def track_user_action(action, details=None):
     """Track user actions for analytics"""
     try:
-        analytics_data = {
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "details": details,
-            "session_id": st.session_state.get("session_id", "unknown"),
-            "page": "mixbot_main"
-        }
-        
-        # Log to file (for simple tracking)
-        with open("user_analytics.jsonl", "a") as f:
-            f.write(json.dumps(analytics_data) + "\n")
-        
-        return analytics_data
+        if _skip_event(action, details):
+            return None
+        return _emit_event(action, {"details": details})
     except Exception as e:
         # Silently fail if analytics fails
         pass
@@ -72,26 +235,16 @@ def track_analysis_completion(analysis_time, file_size):
 def track_error(error_type, error_message, error_details=None, user_context=None):
     """Track errors for debugging and improvement"""
     try:
-        error_data = {
-            "timestamp": datetime.now().isoformat(),
-            "action": "error",
+        # One queued record; the sink writes it to the error log and references it from the main analytics
+        error_data = _emit_event("error", {
             "error_type": error_type,
             "error_message": str(error_message),
             "error_details": error_details,
             "user_context": user_context,
-            "session_id": st.session_state.get("session_id", "unknown"),
-            "page": "mixbot_main",
             "user_agent": st.session_state.get("user_agent", "unknown"),
             "file_uploaded": st.session_state.get("file_uploaded", False),
             "daw_selected": st.session_state.get("daw_selected", "none")
-        }
-        
-        # Log to error file
-        with open("error_log.jsonl", "a") as f:
-            f.write(json.dumps(error_data) + "\n")
-        
-        # Also log to main analytics
-        track_user_action("error", error_data)
+        }, also_error_log=True)
         
         return error_data
     except Exception as e:
@@ -185,7 +338,7 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling
-st.markdown("""
+PAGE_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -332,7 +485,25 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _minified_css():
+    """PAGE_CSS without comments and insignificant whitespace, built once per process"""
+    css = re.sub(r"/\*.*?\*/", "", PAGE_CSS, flags=re.S)
+    return re.sub(r"\s*([{};:,>])\s*|\s+", lambda m: m.group(1) or " ", css).strip()
+
+# Streamlit drops any element a rerun doesn't re-emit, so the style block has to
+# be sent every run; sending the minified form keeps that payload small
+st.markdown(_minified_css(), unsafe_allow_html=True)
+
+# One "Quick Stats" card
+METRIC_CARD_TEMPLATE = """
+<div class="metric-card">
+    <h3>{title}</h3>
+    <h2>{value}</h2>
+</div>
+"""
 
 # Initialize session state
 if 'analysis_results' not in st.session_state:
@@ -340,46 +511,64 @@ if 'analysis_results' not in st.session_state:
 if 'feedback_generated' not in st.session_state:
     st.session_state.feedback_generated = False
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _analyze_upload(digest, _uploaded_file, _problems):
+    """Run analysis on an uploaded file, cached by its content ``digest``
+
+    ``_uploaded_file`` is left out of the cache key (leading underscore), so
+    re-analyzing identical audio is served from cache without re-hashing the
+    upload object. Exceptions are not cached.
+    
+    Nothing is tracked in here, since a cache hit skips the body. Instead
+    ``_problems`` (also not part of the key) collects what went wrong during
+    this call for the caller to track: "analysis" for an exception from
+    analyze_audio, "cleanup" for a temp file that couldn't be removed.
+    """
+    _uploaded_file.seek(0)
+    tmp_file_path = None
+    if _uploaded_file.name.rsplit('.', 1)[-1].upper() in sf.available_formats():
+        # The upload is already held in memory and soundfile can decode this
+        # format straight from it, so skip the temp file round trip
+        source = _uploaded_file
+    else:
+        # Save uploaded file to temporary location, streaming it across in 1 MiB
+        # chunks rather than materializing a second copy with getvalue()
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav', buffering=1 << 20) as tmp_file:
+            shutil.copyfileobj(_uploaded_file, tmp_file, length=1 << 20)
+            source = tmp_file_path = tmp_file.name
+    
+    try:
+        # Run analysis
+        return analyze_audio(source, verbose=False)
+    except Exception as analysis_error:
+        _problems["analysis"] = analysis_error
+        raise
+    finally:
+        # Clean up temporary file
+        if tmp_file_path:
+            try:
+                os.unlink(tmp_file_path)
+            except Exception as cleanup_error:
+                _problems["cleanup"] = cleanup_error
+
 def load_and_analyze_audio(uploaded_file):
-    """Load uploaded audio file and run analysis"""
+    """Load uploaded audio file and run analysis, returning the metrics dict (None on failure)"""
+    problems = {}
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
+        # Hash the upload's buffer in place; BLAKE2b is cheap next to the analysis itself
+        with uploaded_file.getbuffer() as buffer:
+            digest = hashlib.blake2b(buffer, digest_size=16).hexdigest()
+        return _analyze_upload(digest, uploaded_file, problems)
         
-        # Capture the output from analyze_audio
-        import sys
-        from io import StringIO
-        
-        # Redirect stdout to capture analysis output
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
-        
-        try:
-            # Run analysis
-            analyze_audio(tmp_file_path)
-            analysis_output = captured_output.getvalue()
-        except Exception as analysis_error:
+    except Exception as e:
+        if "analysis" in problems:
             # Track analysis-specific errors
             track_analysis_error(
                 analysis_step="audio_analysis",
                 error_type="analysis_failed",
-                error_message=str(analysis_error),
+                error_message=str(problems["analysis"]),
                 metrics={}
             )
-            raise analysis_error
-        finally:
-            sys.stdout = old_stdout
-            # Clean up temporary file
-            try:
-                os.unlink(tmp_file_path)
-            except Exception as cleanup_error:
-                track_error("file_cleanup_failed", str(cleanup_error))
-        
-        return analysis_output, tmp_file_path
-        
-    except Exception as e:
         # Track file processing errors
         track_file_processing_error(
             file_name=uploaded_file.name,
@@ -388,717 +577,70 @@ def load_and_analyze_audio(uploaded_file):
             error_message=str(e)
         )
         st.error(f"Error analyzing audio: {str(e)}")
-        return None, None
+        return None
+    finally:
+        if "cleanup" in problems:
+            track_error("file_cleanup_failed", str(problems["cleanup"]))
 
-def extract_metrics_from_output(analysis_output):
-    """Extract key metrics from analysis output"""
-    metrics = {}
-    
-    # Extract duration
-    if "Duration:" in analysis_output:
-        duration_line = [line for line in analysis_output.split('\n') if "Duration:" in line][0]
-        duration_str = duration_line.split("Duration:")[1].strip()
-        metrics['duration'] = duration_str
-    
-    # Extract RMS
-    if "dB:" in analysis_output:
-        rms_lines = [line for line in analysis_output.split('\n') if "dB:" in line and "RMS" in line]
-        if rms_lines:
-            rms_db = rms_lines[0].split("dB:")[1].strip()
-            metrics['rms_db'] = float(rms_db.split()[0])
-    
-    # Extract peak level
-    if "Peak level:" in analysis_output:
-        peak_line = [line for line in analysis_output.split('\n') if "Peak level:" in line][0]
-        peak_db = peak_line.split("Peak level:")[1].strip()
-        metrics['peak_db'] = float(peak_db.split()[0])
-    
-    # Extract tempo
-    if "BPM" in analysis_output:
-        tempo_lines = [line for line in analysis_output.split('\n') if "BPM" in line and "Tempo:" in line]
-        if tempo_lines:
-            tempo_str = tempo_lines[0].split("Tempo:")[1].split("BPM")[0].strip()
-            metrics['tempo'] = float(tempo_str)
-    
-    # Extract silence percentage
-    if "Silence:" in analysis_output:
-        silence_lines = [line for line in analysis_output.split('\n') if "Silence:" in line and "%" in line]
-        if silence_lines:
-            silence_str = silence_lines[0].split("Silence:")[1].split("%")[0].strip()
-            metrics['silence_percentage'] = float(silence_str)
-    
-    # Extract clipping status
-    if "Likely clipped:" in analysis_output:
-        clip_line = [line for line in analysis_output.split('\n') if "Likely clipped:" in line][0]
-        clip_status = clip_line.split("Likely clipped:")[1].strip()
-        metrics['clipping'] = "YES" in clip_status
-    
-    return metrics
+# Feedback report tabs in display order: (tab label, feedback section key)
+FEEDBACK_TABS = (
+    ("🎵 Overall Assessment", 'overall'),
+    ("🔊 Loudness", 'loudness'),
+    ("🎚️ Clipping", 'clipping'),
+    ("🎛️ EQ", 'eq'),
+    ("🎚️ Compression", 'compression'),
+    ("✨ Effects", 'effects'),
+    ("🎭 Vibe", 'vibe'),
+    ("🎚️ Mastering", 'mastering'),
+)
 
-def get_daw_plugins(daw):
-    """Get DAW-specific plugin recommendations"""
-    
-    plugins = {
-        "FL Studio": {
-            "eq": """
-- **Fruity Parametric EQ 2**: Surgical EQ with spectrum analyzer
-- **Fruity Filter**: High-pass/low-pass filtering
-- **Maximus**: Multiband compression and limiting
-- **Fruity Limiter**: Peak limiting and compression
-- **Fruity Reverb 2**: Convolution reverb
-- **Fruity Delay 3**: Stereo delay with sync
-- **Fruity Distortion**: Saturation and distortion
-- **Fruity Compressor**: Classic compression
-- **Fruity Stereo Enhancer**: Stereo width
-- **Fruity Chorus**: Modulation effects""",
-            
-            "third_party": """
-- **FabFilter Pro-Q 3**: Professional parametric EQ
-- **Waves SSL E-Channel**: Console-style EQ and compression
-- **iZotope Ozone**: Mastering suite
-- **Valhalla Room**: Algorithmic reverb
-- **Soundtoys EchoBoy**: Vintage delay emulation
-- **Waves CLA-76**: 1176-style compression
-- **FabFilter Pro-C 2**: Professional compression
-- **iZotope Neutron**: Mixing assistant
-- **Waves H-Delay**: Stereo delay
-- **Soundtoys Decapitator**: Saturation and distortion""",
-            
-            "compression": """
-- **Fruity Compressor**: Classic compression with visual feedback
-- **Maximus**: Multiband compression and limiting
-- **Fruity Limiter**: Peak limiting and compression
-- **Fruity Multiband Compressor**: Frequency-specific compression
-- **Fruity Peak Controller**: Side-chain compression
-- **Fruity Balance**: Volume automation
-- **Fruity Formula Controller**: Custom compression curves""",
-            
-            "expansion": """
-- **Fruity Compressor**: Use in expansion mode
-- **Fruity Peak Controller**: Dynamic expansion
-- **Fruity Formula Controller**: Custom expansion curves
-- **Fruity Balance**: Volume automation for expansion""",
-            
-            "effects": """
-- **Fruity Reverb 2**: Convolution reverb with presets
-- **Fruity Delay 3**: Stereo delay with tempo sync
-- **Fruity Chorus**: Modulation and chorus effects
-- **Fruity Flangus**: Flanger and phaser effects
-- **Fruity Distortion**: Saturation and distortion
-- **Fruity Stereo Enhancer**: Stereo width and enhancement
-- **Fruity Phaser**: Phase shifting effects
-- **Fruity Delay Bank**: Multiple delay lines
-- **Fruity Reeverb 2**: Algorithmic reverb
-- **Fruity Convolver**: Convolution effects"""
-        },
-        
-        "Ableton Live": {
-            "eq": """
-- **EQ Eight**: 8-band parametric EQ with spectrum
-- **EQ Three**: Simple 3-band EQ for quick adjustments
-- **Auto Filter**: Auto-wah and filter effects
-- **Multiband Dynamics**: Multiband compression
-- **Utility**: Stereo width and phase adjustment
-- **Spectrum**: Real-time spectrum analyzer
-- **Tuner**: Pitch detection and tuning
-- **Frequency Shifter**: Frequency manipulation""",
-            
-            "compression": """
-- **Compressor**: Classic compression with visual feedback
-- **Glue Compressor**: SSL-style bus compression
-- **Multiband Dynamics**: Frequency-specific compression
-- **Limiter**: Peak limiting and clipping prevention
-- **Gate**: Noise gate and expansion
-- **Drum Buss**: Drum-specific compression and saturation
-- **Dynamic Tube**: Tube saturation and compression""",
-            
-            "expansion": """
-- **Gate**: Noise gate and expansion
-- **Multiband Dynamics**: Expansion in specific frequency bands
-- **Compressor**: Use in expansion mode
-- **Dynamic Tube**: Tube expansion effects""",
-            
-            "effects": """
-- **Reverb**: Algorithmic reverb with multiple algorithms
-- **Delay**: Stereo delay with tempo sync
-- **Echo**: Vintage delay emulation
-- **Chorus**: Modulation and chorus effects
-- **Flanger**: Flanging effects
-- **Phaser**: Phase shifting effects
-- **Auto Pan**: Automatic panning
-- **Auto Filter**: Auto-wah and filter effects
-- **Saturator**: Saturation and distortion
-- **Overdrive**: Overdrive effects""",
-            
-            "third_party": """
-- **FabFilter Pro-Q 3**: Professional parametric EQ
-- **Waves SSL E-Channel**: Console-style EQ and compression
-- **iZotope Ozone**: Mastering suite
-- **Valhalla Room**: Algorithmic reverb
-- **Soundtoys EchoBoy**: Vintage delay emulation
-- **Waves CLA-76**: 1176-style compression
-- **FabFilter Pro-C 2**: Professional compression
-- **iZotope Neutron**: Mixing assistant
-- **Waves H-Delay**: Stereo delay
-- **Soundtoys Decapitator**: Saturation and distortion"""
-        },
-        
-        "Logic Pro": {
-            "eq": """
-- **Channel EQ**: 8-band parametric EQ with spectrum
-- **Linear Phase EQ**: Phase-corrected EQ
-- **Match EQ**: Match frequency response of reference
-- **Single Band EQ**: Simple single-band EQ
-- **Fat EQ**: Vintage EQ emulation
-- **Vintage Console EQ**: Console-style EQ
-- **Vintage Graphic EQ**: Graphic EQ emulation
-- **Spectrum Analyzer**: Real-time spectrum display""",
-            
-            "compression": """
-- **Compressor**: Classic compression with multiple algorithms
-- **Vintage FET Compressor**: 1176-style compression
-- **Vintage VCA Compressor**: SSL-style compression
-- **Vintage Opto Compressor**: LA-2A-style compression
-- **Multipressor**: Multiband compression
-- **Adaptive Limiter**: Peak limiting and clipping prevention
-- **Enveloper**: Envelope-based compression
-- **Dynamics Processor**: Advanced dynamics control""",
-            
-            "expansion": """
-- **Noise Gate**: Noise gate and expansion
-- **Enveloper**: Envelope-based expansion
-- **Dynamics Processor**: Advanced expansion control
-- **Compressor**: Use in expansion mode""",
-            
-            "effects": """
-- **Space Designer**: Convolution reverb
-- **ChromaVerb**: Algorithmic reverb
-- **Stereo Delay**: Stereo delay with tempo sync
-- **Tape Delay**: Vintage delay emulation
-- **Chorus**: Modulation and chorus effects
-- **Flanger**: Flanging effects
-- **Phaser**: Phase shifting effects
-- **Tremolo**: Tremolo effects
-- **Distortion**: Distortion and saturation
-- **Bitcrusher**: Bit reduction and sample rate effects"""
-        },
-        
-        "Pro Tools": {
-            "eq": """
-- **EQ3**: 7-band parametric EQ
-- **EQ7**: 7-band parametric EQ with spectrum
-- **Channel Strip**: Console-style EQ and dynamics
-- **DigiRack EQ**: Classic Pro Tools EQ
-- **BF-2A**: Pultec-style EQ
-- **BF-3A**: 3-band parametric EQ
-- **BF-76**: 1176-style compressor with EQ
-- **BF-2A**: LA-2A-style compressor with EQ""",
-            
-            "compression": """
-- **Dyn3 Compressor**: Classic compression
-- **Dyn3 Compressor/Limiter**: Compression and limiting
-- **Dyn3 Expander/Gate**: Expansion and gating
-- **Channel Strip**: Console-style compression
-- **BF-76**: 1176-style compression
-- **BF-2A**: LA-2A-style compression
-- **BF-3A**: 3-band compression
-- **Multiband Dynamics**: Frequency-specific compression""",
-            
-            "expansion": """
-- **Dyn3 Expander/Gate**: Expansion and gating
-- **Channel Strip**: Console-style expansion
-- **BF-3A**: 3-band expansion
-- **Multiband Dynamics**: Frequency-specific expansion""",
-            
-            "effects": """
-- **D-Verb**: Algorithmic reverb
-- **Space**: Convolution reverb
-- **Mod Delay III**: Stereo delay with modulation
-- **Long Delay III**: Long delay effects
-- **Short Delay III**: Short delay effects
-- **Flanger**: Flanging effects
-- **Chorus**: Chorus effects
-- **Phaser**: Phase shifting effects
-- **Lo-Fi**: Bit reduction and sample rate effects
-- **SansAmp**: Amp simulation and distortion"""
-        },
-        
-        "Cubase": {
-            "eq": """
-- **Frequency**: 8-band parametric EQ
-- **StudioEQ**: Professional parametric EQ
-- **GEQ-30**: 30-band graphic EQ
-- **VST Amp Rack**: Amp simulation with EQ
-- **Multiband Compressor**: Multiband compression with EQ
-- **Channel Strip**: Console-style EQ and dynamics
-- **Spectrum Analyzer**: Real-time spectrum display""",
-            
-            "compression": """
-- **Compressor**: Classic compression
-- **Multiband Compressor**: Frequency-specific compression
-- **Tube Compressor**: Tube compression emulation
-- **Vintage Compressor**: Vintage compression emulation
-- **Limiter**: Peak limiting
-- **Gate**: Noise gate and expansion
-- **Envelope Shaper**: Envelope-based compression""",
-            
-            "expansion": """
-- **Gate**: Noise gate and expansion
-- **Envelope Shaper**: Envelope-based expansion
-- **Multiband Compressor**: Frequency-specific expansion
-- **Compressor**: Use in expansion mode""",
-            
-            "effects": """
-- **Reverb**: Algorithmic reverb
-- **Roomworks**: Room simulation
-- **REVerence**: Convolution reverb
-- **Delay**: Stereo delay with tempo sync
-- **ModMachine**: Modulation effects
-- **Chorus**: Chorus effects
-- **Flanger**: Flanging effects
-- **Phaser**: Phase shifting effects
-- **Distortion**: Distortion and saturation
-- **Bitcrusher**: Bit reduction effects"""
-        },
-        
-        "Reaper": {
-            "eq": """
-- **ReaEQ**: Parametric EQ with spectrum
-- **ReaFir**: Linear phase EQ and spectrum analyzer
-- **ReaXcomp**: Multiband compression with EQ
-- **ReaComp**: Compression with side-chain EQ
-- **JS: Graphic EQ**: Graphic EQ
-- **JS: 3-Band EQ**: Simple 3-band EQ
-- **JS: 5-Band EQ**: Simple 5-band EQ
-- **JS: 7-Band EQ**: Simple 7-band EQ""",
-            
-            "compression": """
-- **ReaComp**: Classic compression with side-chain
-- **ReaXcomp**: Multiband compression
-- **ReaGate**: Noise gate and expansion
-- **ReaLimit**: Peak limiting
-- **JS: Compressor**: Simple compression
-- **JS: Limiter**: Simple limiting
-- **JS: Gate**: Simple gating
-- **JS: Multiband Compressor**: Multiband compression""",
-            
-            "expansion": """
-- **ReaGate**: Noise gate and expansion
-- **JS: Gate**: Simple gating and expansion
-- **ReaComp**: Use in expansion mode
-- **JS: Compressor**: Use in expansion mode""",
-            
-            "effects": """
-- **ReaVerb**: Convolution reverb
-- **ReaDelay**: Stereo delay with tempo sync
-- **ReaChorus**: Chorus effects
-- **ReaFlanger**: Flanging effects
-- **ReaPhaser**: Phase shifting effects
-- **ReaTune**: Pitch correction
-- **ReaPitch**: Pitch shifting
-- **JS: Reverb**: Simple reverb
-- **JS: Delay**: Simple delay
-- **JS: Chorus**: Simple chorus"""
-        },
-        
-        "Studio One": {
-            "eq": """
-- **Pro EQ**: Professional parametric EQ
-- **Splitter**: Multiband processing with EQ
-- **Channel Strip**: Console-style EQ and dynamics
-- **Mix Tool**: Simple EQ and dynamics
-- **Tone Generator**: Test tone generator
-- **Spectrum Meter**: Real-time spectrum display
-- **VU Meter**: VU metering
-- **Phase Meter**: Phase correlation meter""",
-            
-            "compression": """
-- **Compressor**: Classic compression
-- **Multiband Dynamics**: Multiband compression
-- **Channel Strip**: Console-style compression
-- **Mix Tool**: Simple compression
-- **Limiter**: Peak limiting
-- **Gate**: Noise gate and expansion
-- **Envelope Shaper**: Envelope-based compression
-- **Splitter**: Multiband processing""",
-            
-            "expansion": """
-- **Gate**: Noise gate and expansion
-- **Envelope Shaper**: Envelope-based expansion
-- **Multiband Dynamics**: Frequency-specific expansion
-- **Splitter**: Multiband processing for expansion""",
-            
-            "effects": """
-- **Room Reverb**: Algorithmic reverb
-- **Open Air**: Convolution reverb
-- **Delay**: Stereo delay with tempo sync
-- **Chorus**: Chorus effects
-- **Flanger**: Flanging effects
-- **Phaser**: Phase shifting effects
-- **Tremolo**: Tremolo effects
-- **Distortion**: Distortion and saturation
-- **Bitcrusher**: Bit reduction effects
-- **Mix Tool**: Simple effects processing"""
-        },
-        
-        "Bitwig Studio": {
-            "eq": """
-- **EQ+**: Parametric EQ with spectrum
-- **EQ-5**: 5-band parametric EQ
-- **Multiband**: Multiband processing with EQ
-- **Channel EQ**: Console-style EQ
-- **Spectrum**: Real-time spectrum analyzer
-- **Tuner**: Pitch detection and tuning
-- **Frequency Shifter**: Frequency manipulation
-- **Resonator**: Resonant filter effects""",
-            
-            "compression": """
-- **Compressor**: Classic compression
-- **Multiband**: Multiband compression
-- **Limiter**: Peak limiting
-- **Gate**: Noise gate and expansion
-- **Transient**: Transient shaping
-- **Channel**: Console-style compression
-- **Dynamics**: Advanced dynamics control
-- **Sidechain**: Side-chain compression""",
-            
-            "expansion": """
-- **Gate**: Noise gate and expansion
-- **Transient**: Transient expansion
-- **Dynamics**: Advanced expansion control
-- **Multiband**: Frequency-specific expansion""",
-            
-            "effects": """
-- **Reverb**: Algorithmic reverb
-- **Delay**: Stereo delay with tempo sync
-- **Chorus**: Chorus effects
-- **Flanger**: Flanging effects
-- **Phaser**: Phase shifting effects
-- **Tremolo**: Tremolo effects
-- **Distortion**: Distortion and saturation
-- **Bitcrusher**: Bit reduction effects
-- **Resonator**: Resonant filter effects
-- **Frequency Shifter**: Frequency manipulation"""
-        },
-        
-        "Serato DJ Pro": {
-            "eq": """
-- **3-Band EQ**: High, mid, low frequency control
-- **Filter**: High-pass and low-pass filters
-- **FX Units**: Reverb, delay, echo, flanger
-- **Sample Player**: Trigger samples and loops
-- **Pitch Control**: Key and tempo adjustment
-- **Auto Gain**: Automatic level matching
-- **Isolator**: Cut frequencies completely""",
-            
-            "compression": """
-- **Auto Gain**: Automatic level matching between tracks
-- **Limiter**: Prevent clipping during transitions
-- **Compressor**: Control dynamic range
-- **Gate**: Reduce unwanted noise
-- **Level Matching**: Consistent track levels""",
-            
-            "expansion": """
-- **Gate**: Reduce noise and unwanted sounds
-- **Auto Gain**: Dynamic level adjustment
-- **Filter**: Frequency-based expansion""",
-            
-            "effects": """
-- **Reverb**: Add space and atmosphere
-- **Delay**: Create rhythmic effects
-- **Echo**: Classic DJ echo effect
-- **Flanger**: Modulate frequency
-- **Filter**: Sweep frequencies for transitions
-- **Phaser**: Phase shifting effects
-- **Chorus**: Modulation effects
-- **Distortion**: Add grit and character""",
-            
-            "third_party": """
-- **Serato DJ Pro**: Professional DJ software
-- **Serato Sample**: Sample triggering and manipulation
-- **Serato FX**: Advanced effects processing
-- **Serato Pitch 'n Time**: Advanced pitch and tempo control
-- **Serato Video**: Video mixing capabilities"""
-        },
-        
-        "Rekordbox": {
-            "eq": """
-- **3-Band EQ**: High, mid, low control
-- **Isolator**: Cut frequencies completely
-- **Filter**: High-pass and low-pass
-- **Color FX**: Frequency-based effects
-- **Beat FX**: Tempo-synced effects
-- **Auto Gain**: Match track levels
-- **Quantize**: Beat-synced effects""",
-            
-            "compression": """
-- **Auto Gain**: Match track levels automatically
-- **Limiter**: Prevent distortion
-- **Compressor**: Control dynamics
-- **Gate**: Noise reduction
-- **Level Matching**: Consistent levels across tracks""",
-            
-            "expansion": """
-- **Gate**: Noise reduction and expansion
-- **Auto Gain**: Dynamic level adjustment
-- **Filter**: Frequency-based expansion""",
-            
-            "effects": """
-- **Reverb**: Add space and atmosphere
-- **Delay**: Create rhythmic effects
-- **Echo**: Classic DJ echo
-- **Flanger**: Modulate frequency
-- **Filter**: Sweep frequencies
-- **Phaser**: Phase shifting
-- **Chorus**: Modulation effects
-- **Distortion**: Add character""",
-            
-            "third_party": """
-- **Rekordbox**: Pioneer's professional DJ software
-- **Pioneer CDJs**: Hardware integration
-- **Pioneer DJM Mixers**: Hardware effects
-- **Rekordbox Video**: Video mixing capabilities"""
-        },
-        
-        "Traktor Pro": {
-            "eq": """
-- **3-Band EQ**: High, mid, low control
-- **Filter**: High-pass and low-pass
-- **FX Units**: Advanced effects processing
-- **Remix Decks**: Sample triggering
-- **Stems**: Multitrack mixing
-- **Auto Gain**: Level matching
-- **Isolator**: Frequency cutting""",
-            
-            "compression": """
-- **Auto Gain**: Automatic level matching
-- **Limiter**: Prevent clipping
-- **Compressor**: Dynamic control
-- **Gate**: Noise reduction
-- **Level Matching**: Consistent levels""",
-            
-            "expansion": """
-- **Gate**: Noise reduction and expansion
-- **Auto Gain**: Dynamic level adjustment
-- **Filter**: Frequency-based expansion""",
-            
-            "effects": """
-- **Reverb**: Add space and atmosphere
-- **Delay**: Create rhythmic effects
-- **Echo**: Classic DJ echo
-- **Flanger**: Modulate frequency
-- **Filter**: Sweep frequencies
-- **Phaser**: Phase shifting
-- **Chorus**: Modulation effects
-- **Distortion**: Add character
-- **Remix Decks**: Sample manipulation""",
-            
-            "third_party": """
-- **Traktor Pro**: Native Instruments DJ software
-- **Traktor Kontrol**: Hardware controllers
-- **Traktor Audio**: Audio interfaces
-- **Traktor Stems**: Multitrack mixing"""
-        },
-        
-        "Virtual DJ": {
-            "eq": """
-- **3-Band EQ**: High, mid, low control
-- **Filter**: High-pass and low-pass
-- **FX Units**: Effects processing
-- **Auto Gain**: Level matching
-- **Isolator**: Frequency cutting
-- **Spectrum**: Real-time analyzer
-- **Pitch Control**: Tempo and key adjustment""",
-            
-            "compression": """
-- **Auto Gain**: Automatic level matching
-- **Limiter**: Prevent clipping
-- **Compressor**: Dynamic control
-- **Gate**: Noise reduction
-- **Level Matching**: Consistent levels""",
-            
-            "expansion": """
-- **Gate**: Noise reduction and expansion
-- **Auto Gain**: Dynamic level adjustment
-- **Filter**: Frequency-based expansion""",
-            
-            "effects": """
-- **Reverb**: Add space and atmosphere
-- **Delay**: Create rhythmic effects
-- **Echo**: Classic DJ echo
-- **Flanger**: Modulate frequency
-- **Filter**: Sweep frequencies
-- **Phaser**: Phase shifting
-- **Chorus**: Modulation effects
-- **Distortion**: Add character
-- **Video Mixing**: Video effects""",
-            
-            "third_party": """
-- **Virtual DJ**: Affordable DJ software
-- **Virtual DJ Pro**: Professional features
-- **Virtual DJ Video**: Video mixing capabilities
-- **Virtual DJ Karaoke**: Karaoke features"""
-        }
-    }
-    
-    return plugins.get(daw, {
-        "eq": "- Use built-in EQ plugins for your DAW",
-        "compression": "- Use built-in compression plugins for your DAW", 
-        "expansion": "- Use built-in expansion plugins for your DAW",
-        "effects": "- Use built-in effects plugins for your DAW",
-        "third_party": "- Consider professional third-party plugins for your DAW"
-    })
+# The metrics the feedback report depends on
+FEEDBACK_METRICS = ('rms_db', 'peak_db', 'tempo', 'clipping')
 
+def generate_gpt_feedback(metrics, daw, vibe=""):
+    """Generate GPT-style feedback based on metrics and user inputs
 
-def analyze_genre_characteristics(tempo, vibe, metrics):
-    """Analyze genre characteristics based on tempo, vibe, and metrics"""
-    
-    # Default genre analysis
-    genre_info = {
-        'genre': 'Unknown',
-        'characteristics': [],
-        'loudness_target': -14,
-        'compression_style': 'moderate',
-        'eq_focus': 'balanced'
-    }
-    
-    # Analyze based on vibe keywords
-    vibe_lower = vibe.lower() if vibe else ""
-    
-    if any(word in vibe_lower for word in ['hip', 'rap', 'trap', 'drill', 'jay', 'kendrick', 'drake']):
-        genre_info.update({
-            'genre': 'Hip-Hop/Rap',
-            'characteristics': ['heavy bass', 'punchy drums', 'clear vocals', 'wide stereo'],
-            'loudness_target': -10,
-            'compression_style': 'aggressive',
-            'eq_focus': 'bass and presence'
-        })
-    elif any(word in vibe_lower for word in ['edm', 'electronic', 'dance', 'house', 'techno', 'trance']):
-        genre_info.update({
-            'genre': 'Electronic/Dance',
-            'characteristics': ['punchy kick', 'wide stereo', 'bright highs', 'tight compression'],
-            'loudness_target': -8,
-            'compression_style': 'tight',
-            'eq_focus': 'kick and highs'
-        })
-    elif any(word in vibe_lower for word in ['rock', 'guitar', 'band', 'live']):
-        genre_info.update({
-            'genre': 'Rock',
-            'characteristics': ['guitar presence', 'punchy drums', 'vocal clarity', 'natural dynamics'],
-            'loudness_target': -12,
-            'compression_style': 'moderate',
-            'eq_focus': 'guitars and vocals'
-        })
-    elif any(word in vibe_lower for word in ['pop', 'mainstream', 'radio']):
-        genre_info.update({
-            'genre': 'Pop',
-            'characteristics': ['vocal forward', 'bright mix', 'wide stereo', 'consistent levels'],
-            'loudness_target': -10,
-            'compression_style': 'consistent',
-            'eq_focus': 'vocals and brightness'
-        })
-    elif any(word in vibe_lower for word in ['acoustic', 'folk', 'singer', 'guitar']):
-        genre_info.update({
-            'genre': 'Acoustic/Folk',
-            'characteristics': ['natural dynamics', 'warm tones', 'minimal processing', 'space'],
-            'loudness_target': -16,
-            'compression_style': 'gentle',
-            'eq_focus': 'warmth and clarity'
-        })
-    
-    # Override with tempo-based analysis if no vibe detected
-    if genre_info['genre'] == 'Unknown':
-        if tempo > 140:
-            genre_info.update({
-                'genre': 'Fast Electronic/Dance',
-                'characteristics': ['high energy', 'tight compression', 'bright mix'],
-                'loudness_target': -8,
-                'compression_style': 'tight',
-                'eq_focus': 'kick and highs'
-            })
-        elif tempo > 120:
-            genre_info.update({
-                'genre': 'Pop/Rock',
-                'characteristics': ['moderate energy', 'balanced mix', 'clear vocals'],
-                'loudness_target': -12,
-                'compression_style': 'moderate',
-                'eq_focus': 'balanced'
-            })
-        elif tempo > 90:
-            genre_info.update({
-                'genre': 'Hip-Hop/Rap',
-                'characteristics': ['punchy drums', 'heavy bass', 'clear vocals'],
-                'loudness_target': -10,
-                'compression_style': 'aggressive',
-                'eq_focus': 'bass and presence'
-            })
-        else:
-            genre_info.update({
-                'genre': 'Slow/Ambient',
-                'characteristics': ['atmospheric', 'gentle dynamics', 'warm tones'],
-                'loudness_target': -16,
-                'compression_style': 'gentle',
-                'eq_focus': 'warmth and space'
-            })
-    
-    return genre_info
+    Reports are cached on the metrics they use plus DAW and vibe, so asking
+    again for the same track and settings is a cache hit.
+    """
+    used_metrics = tuple((key, metrics[key]) for key in FEEDBACK_METRICS if key in metrics)
+    return _feedback_sections(used_metrics, daw, vibe)
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _feedback_sections(used_metrics, daw, vibe):
+    """Build the feedback sections from ``(key, value)`` metric pairs
 
-def generate_gpt_feedback(metrics, daw, vibe=""):
-    """Generate GPT-style feedback based on metrics and user inputs"""
-    
+    Everything the sections depend on is in the arguments, so the cache key
+    fully decides the output. The genre analysis is derived here from the
+    tempo and vibe; analyze_genre_characteristics memoizes it, so the call
+    the page already made for the same tempo and vibe is reused.
+    """
+    metrics = dict(used_metrics)
     feedback_sections = {}
     
-    # Analyze genre characteristics
-    genre_info = analyze_genre_characteristics(metrics.get('tempo', 120), vibe, metrics)
-    
-    # Overall assessment with genre context
+    # Read each metric once, with the same defaults the charts use
     rms_db = metrics.get('rms_db', -20)
+    peak_db = metrics.get('peak_db', -10)
     tempo = metrics.get('tempo', 120)
+    clipping = metrics.get('clipping', False)
+    dynamic_range = peak_db - rms_db
     
-    # Genre-specific assessment
-    if genre_info['genre'] == 'Hip-Hop/Rap':
-        if rms_db < -15:
-            energy_desc = "needs more punch for hip-hop"
-            energy_emoji = "❌"
-        elif rms_db < -10:
-            energy_desc = "has good hip-hop energy"
-            energy_emoji = "✅"
-        else:
-            energy_desc = "is well-mixed for hip-hop"
-            energy_emoji = "🎵"
-    elif genre_info['genre'] == 'Electronic/Dance':
-        if rms_db < -12:
-            energy_desc = "needs more energy for dance music"
-            energy_emoji = "❌"
-        elif rms_db < -8:
-            energy_desc = "has good dance floor energy"
-            energy_emoji = "✅"
-        else:
-            energy_desc = "is well-mixed for electronic music"
-            energy_emoji = "🎵"
-    else:
-        if rms_db < -16:
-            energy_desc = "needs more energy"
-            energy_emoji = "❌"
-        elif rms_db < -12:
-            energy_desc = "has good energy"
-            energy_emoji = "✅"
-        else:
-            energy_desc = "is well-mixed"
-            energy_emoji = "🎵"
+    # Analyze genre characteristics
+    genre_info = analyze_genre_characteristics(tempo, vibe, metrics)
+    
+    # Overall assessment with genre context
+    energy_desc, energy_emoji = energy_assessment(genre_info['genre'], rms_db)
     
     feedback_sections['overall'] = f"""
 🎵 **Overall Assessment - {genre_info['genre']}**
-{energy_emoji} Your track {energy_desc} with a {'good' if not metrics.get('clipping', False) else 'concerning'} dynamic range. 
+{energy_emoji} Your track {energy_desc} with a {'good' if not clipping else 'concerning'} dynamic range. 
 The {tempo:.0f} BPM tempo {'works well' if 80 <= tempo <= 160 else 'may need attention'} for {genre_info['genre'].lower()}.
 
 **Genre Characteristics Detected:**
-{chr(10).join([f"• {char}" for char in genre_info['characteristics']])}
+{genre_info['characteristics_bullets']}
 """
     
     # Genre-aware loudness analysis
-    rms_db = metrics.get('rms_db', 0)
     target_rms = genre_info['loudness_target']
     
     if rms_db > target_rms + 3:
@@ -1132,7 +674,7 @@ Your RMS level is in the sweet spot for {genre_info['genre'].lower()} mastering.
 """
     
     # Clipping analysis
-    if metrics.get('clipping', False):
+    if clipping:
         feedback_sections['clipping'] = """
 ❌ **CRITICAL: Clipping Detected**
 This will destroy your mix quality and cause distortion.
@@ -1178,7 +720,7 @@ This will destroy your mix quality and cause distortion.
 - Monitor your levels constantly during performance
 """
     # Handle clipping for non-DJ software
-    if not metrics.get('clipping', False) and daw not in dj_software:
+    if not clipping and daw not in dj_software:
         feedback_sections['clipping'] = """
 ✅ **No Clipping - Good Headroom Management**
 Your track has proper headroom for mastering.
@@ -1192,50 +734,7 @@ Your track has proper headroom for mastering.
     daw_plugins = get_daw_plugins(daw)
     
     # Genre-specific EQ advice
-    if genre_info['genre'] == 'Hip-Hop/Rap':
-        eq_advice = f"""
-**Hip-Hop/Rap EQ Focus:**
-- **Bass (60-120 Hz)**: Boost for heavy, punchy bass
-- **Kick (80-100 Hz)**: Cut competing frequencies in other tracks
-- **Vocals (2-4 kHz)**: Boost for clarity and presence
-- **Highs (8-12 kHz)**: High-shelf for brightness and air
-- **Low-Mid Cuts**: Cut 200-400 Hz in non-essential tracks to reduce mud
-"""
-    elif genre_info['genre'] == 'Electronic/Dance':
-        eq_advice = f"""
-**Electronic/Dance EQ Focus:**
-- **Kick (60-80 Hz)**: Boost for punch and dance floor impact
-- **Bass (100-200 Hz)**: Tight, controlled bass
-- **Highs (10-15 kHz)**: Bright, energetic highs
-- **Mid Cuts**: Cut 400-800 Hz to reduce boxiness
-- **Stereo Width**: Enhance 8-12 kHz for wide, open sound
-"""
-    elif genre_info['genre'] == 'Rock':
-        eq_advice = f"""
-**Rock EQ Focus:**
-- **Guitars (2-4 kHz)**: Boost for presence and cut-through
-- **Drums (80-120 Hz)**: Punchy, natural drum sound
-- **Vocals (3-5 kHz)**: Clear, forward vocals
-- **Bass (100-200 Hz)**: Warm, supporting bass
-- **Highs (8-12 kHz)**: Natural brightness without harshness
-"""
-    elif genre_info['genre'] == 'Pop':
-        eq_advice = f"""
-**Pop EQ Focus:**
-- **Vocals (2-5 kHz)**: Forward, clear vocals
-- **Bass (80-150 Hz)**: Tight, controlled bass
-- **Highs (10-15 kHz)**: Bright, radio-friendly highs
-- **Mid Cuts**: Cut 300-600 Hz to reduce mud
-- **Stereo Width**: Wide, open mix
-"""
-    else:
-        eq_advice = f"""
-**General EQ Focus:**
-- **High-Pass Filter**: Apply at 20-30 Hz to remove rumble
-- **Low-Mid Cuts**: Cut 200-400 Hz if mix sounds muddy
-- **Presence Boost**: Boost 2-4 kHz for clarity and definition
-- **Air Frequencies**: High-shelf 8-12 kHz for brightness
-"""
+    eq_advice = EQ_ADVICE_BY_GENRE.get(genre_info['genre'], GENERAL_EQ_ADVICE)
     
     feedback_sections['eq'] = f"""
 🎛️ **EQ Recommendations for {daw} - {genre_info['genre']}**
@@ -1254,55 +753,8 @@ Based on your track's characteristics:
 """
     
     # Genre-aware compression recommendations with plugin suggestions
-    dynamic_range = metrics.get('peak_db', 0) - metrics.get('rms_db', 0)
-    daw_plugins = get_daw_plugins(daw)
-    
     # Genre-specific compression advice
-    if genre_info['genre'] == 'Hip-Hop/Rap':
-        comp_advice = f"""
-**Hip-Hop/Rap Compression:**
-- **Aggressive compression** on drums for punch
-- **Side-chain compression** on bass from kick
-- **Parallel compression** on vocals for thickness
-- **Multiband compression** on master for control
-- **Attack: 5-15ms, Release: 50-150ms** for punchy sound
-"""
-    elif genre_info['genre'] == 'Electronic/Dance':
-        comp_advice = f"""
-**Electronic/Dance Compression:**
-- **Tight compression** on kick and bass
-- **Side-chain compression** for pumping effect
-- **Parallel compression** on drums for impact
-- **Multiband compression** for frequency control
-- **Attack: 1-10ms, Release: 30-100ms** for tight sound
-"""
-    elif genre_info['genre'] == 'Rock':
-        comp_advice = f"""
-**Rock Compression:**
-- **Moderate compression** on guitars and vocals
-- **Natural compression** on drums
-- **Parallel compression** for thickness
-- **Bus compression** for glue
-- **Attack: 10-30ms, Release: 100-300ms** for natural sound
-"""
-    elif genre_info['genre'] == 'Pop':
-        comp_advice = f"""
-**Pop Compression:**
-- **Consistent compression** on vocals
-- **Tight compression** on drums
-- **Parallel compression** for thickness
-- **Bus compression** for consistency
-- **Attack: 5-20ms, Release: 50-200ms** for consistent sound
-"""
-    else:
-        comp_advice = f"""
-**General Compression:**
-- **Gentle compression** on individual tracks
-- **Parallel compression** for thickness
-- **Side-chain compression** to create space
-- **Multiband compression** for complex material
-- **Attack: 10-30ms, Release: 100-300ms**
-"""
+    comp_advice = COMP_ADVICE_BY_GENRE.get(genre_info['genre'], GENERAL_COMP_ADVICE)
     
     if dynamic_range > 15:
         feedback_sections['compression'] = f"""
@@ -1352,7 +804,7 @@ Your dynamics are well-controlled.
 
 **Delay:**
 - Use delay to create space and movement
-- Sync delays to your {metrics.get('tempo', 120):.0f} BPM tempo
+- Sync delays to your {tempo:.0f} BPM tempo
 - Consider ping-pong delays for width
 
 **Saturation:**
@@ -1421,15 +873,39 @@ Based on your "{vibe}" reference:
     
     return feedback_sections
 
+def build_feedback_report(feedback_sections, daw, vibe):
+    """Plain-text feedback report for the download button"""
+    report_header = f"""
+MIXBOT - AI Mixing Feedback Report
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+DAW: {daw}
+Vibe/Reference: {vibe if vibe else 'Not specified'}
+
+{'='*50}
+
+"""
+    
+    # Join the sections in one pass instead of growing the string section by section
+    return "".join([report_header, *(f"\n{content}\n" for content in feedback_sections.values())])
+
 def create_visualizations(metrics):
     """Create visualizations for the metrics"""
+    return _level_figures(metrics.get('rms_db', -20), metrics.get('peak_db', -10))
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _level_figures(rms_db, peak_db):
+    """Loudness and dynamic range figures, built once per level pair
+
+    Every rerun after an analysis redraws these charts. cache_resource hands
+    back the same figure objects, where cache_data would unpickle copies that
+    cost more than building them. st.plotly_chart only reads the figures.
+    """
+    # Imported here so plotly only loads once a track has actually been analyzed
+    import plotly.graph_objects as go
     
     # Loudness meter
     fig_loudness = go.Figure()
     
-    rms_db = metrics.get('rms_db', -20)
-    peak_db = metrics.get('peak_db', -10)
-    
     # Color coding based on levels
     rms_color = 'red' if rms_db > -8 else 'orange' if rms_db > -12 else 'green'
     peak_color = 'red' if peak_db > -1 else 'orange' if peak_db > -3 else 'green'
@@ -1479,6 +955,21 @@ def create_visualizations(metrics):
     
     return fig_loudness, fig_dynamic
 
+NETWORK_PROBE_URL = "https://httpbin.org/status/200"
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _network_status():
+    """Probe connectivity at most once a minute per server, not on every rerun
+
+    Returns ``(status_code, None)``, or ``(None, error_message)`` if the
+    request failed. Failures are tracked by the caller, so every session that
+    sees one reports it, not just the one that ran the probe.
+    """
+    try:
+        return requests.get(NETWORK_PROBE_URL, timeout=2).status_code, None
+    except Exception as e:
+        return None, str(e)
+
 def main():
     # Initialize analytics
     initialize_analytics()
@@ -1584,33 +1075,32 @@ def main_app_content():
         """, unsafe_allow_html=True)
         
         # Network status indicator
-        try:
-            import requests
-            response = requests.get("https://httpbin.org/status/200", timeout=5)
-            if response.status_code == 200:
-                st.markdown("""
-                <div style="background: #d4edda; border: 1px solid #c3e6cb; border-radius: 5px; padding: 0.5rem; margin-bottom: 1rem;">
-                    <small>🌐 <strong>Network Status:</strong> Connected</small>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div style="background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; padding: 0.5rem; margin-bottom: 1rem;">
-                    <small>⚠️ <strong>Network Status:</strong> Slow connection detected</small>
-                </div>
-                """, unsafe_allow_html=True)
-        except Exception as e:
+        status_code, network_error = _network_status()
+        if network_error is not None:
+            # Track network connectivity issues
+            track_network_error(
+                error_type="connectivity_test_failed",
+                error_message=network_error,
+                url=NETWORK_PROBE_URL
+            )
+        if status_code == 200:
+            st.markdown("""
+            <div style="background: #d4edda; border: 1px solid #c3e6cb; border-radius: 5px; padding: 0.5rem; margin-bottom: 1rem;">
+                <small>🌐 <strong>Network Status:</strong> Connected</small>
+            </div>
+            """, unsafe_allow_html=True)
+        elif status_code is not None:
+            st.markdown("""
+            <div style="background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; padding: 0.5rem; margin-bottom: 1rem;">
+                <small>⚠️ <strong>Network Status:</strong> Slow connection detected</small>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
             st.markdown("""
             <div style="background: #f8d7da; border: 1px solid #f5c6cb; border-radius: 5px; padding: 0.5rem; margin-bottom: 1rem;">
                 <small>❌ <strong>Network Status:</strong> Connection issues detected</small>
             </div>
             """, unsafe_allow_html=True)
-            # Track network connectivity issues
-            track_network_error(
-                error_type="connectivity_test_failed",
-                error_message=str(e),
-                url="https://httpbin.org/status/200"
-            )
         
         st.markdown('<h2 class="sub-header">📁 Upload Your Track</h2>', unsafe_allow_html=True)
         
@@ -1655,14 +1145,21 @@ def main_app_content():
             st.json(file_details)
             
             # Analyze button
-            if st.button("🔍 Analyze Track", type="primary"):
+            analyze_clicked = st.button("🔍 Analyze Track", type="primary")
+            
+            # The same upload (file_id is per upload), DAW and vibe as the report on
+            # screen: keep that report rather than hashing and re-reading the file
+            analysis_input = (uploaded_file.file_id, selected_daw, vibe_reference)
+            if analyze_clicked and analysis_input == st.session_state.get('analysis_input'):
+                st.success("✅ Analysis complete!")
+            elif analyze_clicked:
                 start_time = time.time()
                 try:
                     with st.spinner("Analyzing your track..."):
                         # Run analysis
-                        analysis_output, temp_path = load_and_analyze_audio(uploaded_file)
+                        metrics = load_and_analyze_audio(uploaded_file)
                         
-                        if analysis_output:
+                        if metrics:
                             # Calculate analysis time
                             analysis_time = time.time() - start_time
                             
@@ -1670,21 +1167,9 @@ def main_app_content():
                             track_analysis_completion(analysis_time, uploaded_file.size)
                             
                             # Store results in session state
-                            st.session_state.analysis_results = analysis_output
+                            st.session_state.analysis_results = metrics
                             st.session_state.feedback_generated = True
                             
-                            # Extract metrics
-                            try:
-                                metrics = extract_metrics_from_output(analysis_output)
-                            except Exception as metrics_error:
-                                track_analysis_error(
-                                    analysis_step="metrics_extraction",
-                                    error_type="metrics_parsing_failed",
-                                    error_message=str(metrics_error)
-                                )
-                                st.error("Error extracting metrics from analysis")
-                                return
-                            
                             # Track genre detection
                             if vibe_reference:
                                 try:
@@ -1714,6 +1199,7 @@ def main_app_content():
                             # Store feedback in session state
                             st.session_state.feedback_sections = feedback_sections
                             st.session_state.metrics = metrics
+                            st.session_state.analysis_input = analysis_input
                             
                             st.success("✅ Analysis complete!")
                         else:
@@ -1737,35 +1223,17 @@ def main_app_content():
         if st.session_state.analysis_results and st.session_state.metrics:
             metrics = st.session_state.metrics
             
-            # Display key metrics
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>🎵 Tempo</h3>
-                <h2>{metrics.get('tempo', 0):.0f} BPM</h2>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>🔊 RMS Level</h3>
-                <h2>{metrics.get('rms_db', 0):.1f} dB</h2>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>📊 Peak Level</h3>
-                <h2>{metrics.get('peak_db', 0):.1f} dB</h2>
-            </div>
-            """, unsafe_allow_html=True)
-            
+            # Display key metrics, all four cards in one markdown element
             dynamic_range = metrics.get('peak_db', 0) - metrics.get('rms_db', 0)
-            st.markdown(f"""
-            <div class="metric-card">
-                <h3>🎚️ Dynamic Range</h3>
-                <h2>{dynamic_range:.1f} dB</h2>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown("".join(
+                METRIC_CARD_TEMPLATE.format(title=title, value=value)
+                for title, value in (
+                    ("🎵 Tempo", f"{metrics.get('tempo', 0):.0f} BPM"),
+                    ("🔊 RMS Level", f"{metrics.get('rms_db', 0):.1f} dB"),
+                    ("📊 Peak Level", f"{metrics.get('peak_db', 0):.1f} dB"),
+                    ("🎚️ Dynamic Range", f"{dynamic_range:.1f} dB"),
+                )
+            ), unsafe_allow_html=True)
     
     # Display analysis results
     if st.session_state.analysis_results:
@@ -1773,7 +1241,7 @@ def main_app_content():
         
         # Show raw analysis output in expander
         with st.expander("🔍 View Raw Analysis Data", expanded=False):
-            st.code(st.session_state.analysis_results)
+            st.json(st.session_state.analysis_results)
         
         # Visualizations
         if st.session_state.metrics:
@@ -1792,61 +1260,24 @@ def main_app_content():
         
         feedback_sections = st.session_state.feedback_sections
         
-        # Overall assessment
-        with st.expander("🎵 Overall Assessment", expanded=True):
-            st.markdown(feedback_sections['overall'])
-        
-        # Loudness
-        with st.expander("🔊 Loudness Analysis", expanded=True):
-            st.markdown(feedback_sections['loudness'])
-        
-        # Clipping
-        with st.expander("🎚️ Clipping Analysis", expanded=True):
-            st.markdown(feedback_sections['clipping'])
-        
-        # EQ
-        with st.expander("🎛️ EQ Recommendations", expanded=False):
-            st.markdown(feedback_sections['eq'])
-        
-        # Compression
-        with st.expander("🎚️ Compression Recommendations", expanded=False):
-            st.markdown(feedback_sections['compression'])
-        
-        # Effects
-        with st.expander("✨ Effects Recommendations", expanded=False):
-            st.markdown(feedback_sections['effects'])
-        
-        # Vibe-specific (if provided)
-        if vibe_reference and 'vibe' in feedback_sections:
-            with st.expander("🎭 Vibe-Specific Recommendations", expanded=False):
-                st.markdown(feedback_sections['vibe'])
-        
-        # Mastering preparation
-        with st.expander("🎚️ Mastering Preparation", expanded=False):
-            st.markdown(feedback_sections['mastering'])
+        # One tab per section; the vibe tab only applies while a vibe is entered
+        shown = [
+            (label, key) for label, key in FEEDBACK_TABS
+            if key in feedback_sections and (key != 'vibe' or vibe_reference)
+        ]
+        tabs = st.tabs([label for label, _ in shown])
+        for tab, (_, key) in zip(tabs, shown):
+            with tab:
+                st.markdown(feedback_sections[key])
         
         # Download feedback
         st.markdown("---")
         st.markdown('<h3 class="sub-header">💾 Download Feedback</h3>', unsafe_allow_html=True)
         
-        # Create downloadable text
-        feedback_text = f"""
-MIXBOT - AI Mixing Feedback Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-DAW: {selected_daw}
-Vibe/Reference: {vibe_reference if vibe_reference else 'Not specified'}
-
-{'='*50}
-
-"""
-        
-        for section_name, content in feedback_sections.items():
-            feedback_text += f"\n{content}\n"
-        
-        # Download button
+        # Download button - the report text is only built when the button is clicked
         download_clicked = st.download_button(
             label="📥 Download Feedback Report (.txt)",
-            data=feedback_text,
+            data=partial(build_feedback_report, feedback_sections, selected_daw, vibe_reference),
             file_name=f"mixbot_feedback_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
             mime="text/plain"
         )
@@ -12,26 +12,41 @@ This script analyzes audio files to extract various metrics including:
 Usage: python audio_analyzer.py <audio_file_path>
 """
 
+import os
 import sys
 import argparse
 import numpy as np
 import librosa
 import soundfile as sf
-from typing import Tuple, List
+import joblib
+from typing import Tuple, List, Union, BinaryIO
 
 
-def load_audio(file_path: str) -> Tuple[np.ndarray, int]:
+def load_audio(file_path: Union[str, BinaryIO]) -> Tuple[np.ndarray, int]:
     """
-    Load audio file using librosa.
+    Load audio file using soundfile, falling back to librosa.
     
     Args:
-        file_path: Path to the audio file
+        file_path: Path to the audio file, or a binary file-like object
+            in a format soundfile can decode
         
     Returns:
         Tuple of (audio_data, sample_rate)
     """
     try:
-        # Load audio with librosa (automatically resamples to 22050 Hz)
+        # Read with soundfile directly; this is what librosa.load does for any
+        # format libsndfile can decode, minus the wrapper
+        audio, sr = sf.read(file_path, dtype='float32', always_2d=False)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        return audio, sr
+    except sf.LibsndfileError:
+        # Not decodable by libsndfile - let librosa try its other backends
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)
+    
+    try:
+        # Load audio with librosa at the file's native sample rate
         audio, sr = librosa.load(file_path, sr=None)
         return audio, sr
     except Exception as e:
@@ -74,36 +89,27 @@ def detect_silence(audio: np.ndarray, sample_rate: int,
     window_size = int(0.01 * sample_rate)  # 10ms windows
     hop_size = window_size // 2
     
-    rms_values = []
-    for i in range(0, len(audio) - window_size, hop_size):
-        window = audio[i:i + window_size]
-        rms = np.sqrt(np.mean(window**2))
-        rms_values.append(rms)
-    
-    # Find silence periods
-    silence_periods = []
-    in_silence = False
-    silence_start = 0
-    
-    for i, rms in enumerate(rms_values):
-        time = i * hop_size / sample_rate
-        
-        if rms < threshold_linear and not in_silence:
-            silence_start = time
-            in_silence = True
-        elif rms >= threshold_linear and in_silence:
-            silence_end = time
-            if silence_end - silence_start >= min_silence_duration:
-                silence_periods.append((silence_start, silence_end))
-            in_silence = False
+    # Mean square of every window in one pass over strided views of the signal;
+    # comparing against the squared threshold saves taking the square root
+    n_windows = len(range(0, len(audio) - window_size, hop_size))
+    if n_windows == 0:
+        return []
+    windows = np.lib.stride_tricks.sliding_window_view(audio, window_size)[::hop_size][:n_windows]
+    mean_square = np.einsum('ij,ij->i', windows, windows) / window_size
+    silent = mean_square < threshold_linear**2
+    
+    # Find silence periods: runs of silent windows, from where a run starts to
+    # where the first loud window after it starts
+    edges = np.diff(np.concatenate(([False], silent, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1) * hop_size / sample_rate
+    ends = np.flatnonzero(edges == -1) * hop_size / sample_rate
     
     # Handle case where audio ends in silence
-    if in_silence:
-        silence_end = len(audio) / sample_rate
-        if silence_end - silence_start >= min_silence_duration:
-            silence_periods.append((silence_start, silence_end))
+    if silent[-1]:
+        ends[-1] = len(audio) / sample_rate
     
-    return silence_periods
+    keep = ends - starts >= min_silence_duration
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
 
 
 def calculate_rms(audio: np.ndarray) -> Tuple[float, float]:
@@ -116,22 +122,33 @@ def calculate_rms(audio: np.ndarray) -> Tuple[float, float]:
     Returns:
         Tuple of (RMS in linear scale, RMS in dB)
     """
-    rms_linear = np.sqrt(np.mean(audio**2))
+    # einsum sums the squares without materializing audio**2
+    rms_linear = np.sqrt(np.einsum('i,i->', audio, audio) / audio.size)
     rms_db = 20 * np.log10(rms_linear) if rms_linear > 0 else -np.inf
     return rms_linear, rms_db
 
 
-def estimate_tempo(audio: np.ndarray, sample_rate: int) -> Tuple[float, float]:
+def estimate_tempo(audio: np.ndarray, sample_rate: int, full: bool = False) -> Tuple[float, float]:
     """
     Estimate the tempo (BPM) of the audio.
     
+    Tracks longer than 45 seconds are estimated from the 30 seconds around
+    their center, which is enough for a steady tempo and much faster than
+    tracking beats through the whole file.
+    
     Args:
         audio: Audio data array
         sample_rate: Sample rate in Hz
+        full: Estimate from the whole track regardless of its length
         
     Returns:
         Tuple of (tempo, confidence)
     """
+    if not full and len(audio) > 45 * sample_rate:
+        center = len(audio) // 2
+        half_window = 15 * sample_rate
+        audio = audio[center - half_window:center + half_window]
+    
     try:
         # Use librosa's tempo estimation
         tempo, beats = librosa.beat.beat_track(y=audio, sr=sample_rate)
@@ -141,6 +158,39 @@ def estimate_tempo(audio: np.ndarray, sample_rate: int) -> Tuple[float, float]:
         return 0.0, 0.0
 
 
+# Set MIXBOT_CACHE_DIR to keep tempo estimates for files on disk between runs.
+# Entries are keyed on the file's path, modification time and size, so an
+# edited file is re-analyzed; without the variable nothing is cached
+_tempo_memory = joblib.Memory(os.environ.get("MIXBOT_CACHE_DIR"), verbose=0)
+
+
+@_tempo_memory.cache(ignore=["audio"])
+def _cached_file_tempo(audio: np.ndarray, sample_rate: int, path: str,
+                       mtime_ns: int, size: int) -> Tuple[float, float]:
+    return estimate_tempo(audio, sample_rate)
+
+
+def estimate_file_tempo(file_path: Union[str, BinaryIO], audio: np.ndarray,
+                        sample_rate: int) -> Tuple[float, float]:
+    """
+    Estimate the tempo of a loaded file, reusing a cached estimate if possible.
+    
+    Args:
+        file_path: Path or file-like object the audio was loaded from;
+            only paths are cached
+        audio: Audio data array loaded from file_path
+        sample_rate: Sample rate in Hz
+        
+    Returns:
+        Tuple of (tempo, confidence)
+    """
+    if not isinstance(file_path, str):
+        return estimate_tempo(audio, sample_rate)
+    stat = os.stat(file_path)
+    return _cached_file_tempo(audio, sample_rate, os.path.realpath(file_path),
+                              stat.st_mtime_ns, stat.st_size)
+
+
 def detect_clipping(audio: np.ndarray, sample_rate: int) -> Tuple[bool, float, float]:
     """
     Detect if audio is likely clipped.
@@ -152,8 +202,8 @@ def detect_clipping(audio: np.ndarray, sample_rate: int) -> Tuple[bool, float, f
     Returns:
         Tuple of (is_clipped, peak_level_db, clipping_threshold)
     """
-    # Calculate peak level
-    peak_level = np.max(np.abs(audio))
+    # Calculate peak level from the signal's extremes, without an abs() copy
+    peak_level = max(np.max(audio), -np.min(audio))
     peak_level_db = 20 * np.log10(peak_level) if peak_level > 0 else -np.inf
     
     # Check for clipping (typically above -0.1 dB for digital audio)
@@ -162,7 +212,12 @@ def detect_clipping(audio: np.ndarray, sample_rate: int) -> Tuple[bool, float, f
     
     # Additional check: look for flat peaks (common sign of clipping)
     flat_peak_threshold = 0.99
-    flat_peaks = np.sum(np.abs(audio) > flat_peak_threshold)
+    if peak_level > flat_peak_threshold:
+        flat_peaks = (np.count_nonzero(audio > flat_peak_threshold)
+                      + np.count_nonzero(audio < -flat_peak_threshold))
+    else:
+        # Nothing can be above the threshold if the peak isn't
+        flat_peaks = 0
     flat_peak_ratio = flat_peaks / len(audio)
     
     # If more than 0.1% of samples are at peak, likely clipped
@@ -315,68 +370,91 @@ def generate_mix_feedback(rms_db: float, peak_level_db: float, is_clipped: bool,
     print("   The best mix is the one that serves the song.")
 
 
-def analyze_audio(file_path: str) -> None:
+def analyze_audio(file_path: Union[str, BinaryIO], verbose: bool = True) -> dict:
     """
     Perform comprehensive audio analysis.
     
     Args:
-        file_path: Path to the audio file
+        file_path: Path to the audio file, or a binary file-like object
+            (see load_audio)
+        verbose: Print the analysis report and mixing feedback to stdout
+        
+    Returns:
+        Dictionary of metrics: duration (seconds), rms_db, peak_db,
+        silence_percentage, clipping and, if it could be estimated, tempo
     """
-    print(f"Analyzing audio file: {file_path}")
-    print("=" * 50)
+    if verbose:
+        print(f"Analyzing audio file: {file_path}")
+        print("=" * 50)
     
     # Load audio
     audio, sample_rate = load_audio(file_path)
     
     # 1. Calculate duration
     duration = calculate_duration(audio, sample_rate)
-    print(f"Duration: {duration:.2f} seconds ({duration/60:.2f} minutes)")
+    if verbose:
+        print(f"Duration: {duration:.2f} seconds ({duration/60:.2f} minutes)")
     
     # 2. Detect silence
     silence_periods = detect_silence(audio, sample_rate)
     total_silence_time = sum(end - start for start, end in silence_periods)
     silence_percentage = (total_silence_time / duration) * 100
     
-    print(f"Silence Detection:")
-    print(f"  - Total silence time: {total_silence_time:.2f} seconds ({silence_percentage:.1f}%)")
-    print(f"  - Number of silence periods: {len(silence_periods)}")
-    if silence_periods:
-        print(f"  - Silence periods: {silence_periods[:5]}")  # Show first 5 periods
-        if len(silence_periods) > 5:
-            print(f"    ... and {len(silence_periods) - 5} more")
+    if verbose:
+        print(f"Silence Detection:")
+        print(f"  - Total silence time: {total_silence_time:.2f} seconds ({silence_percentage:.1f}%)")
+        print(f"  - Number of silence periods: {len(silence_periods)}")
+        if silence_periods:
+            print(f"  - Silence periods: {silence_periods[:5]}")  # Show first 5 periods
+            if len(silence_periods) > 5:
+                print(f"    ... and {len(silence_periods) - 5} more")
     
     # 3. Calculate RMS
     rms_linear, rms_db = calculate_rms(audio)
-    print(f"RMS (Loudness):")
-    print(f"  - Linear: {rms_linear:.6f}")
-    print(f"  - dB: {rms_db:.2f} dB")
+    if verbose:
+        print(f"RMS (Loudness):")
+        print(f"  - Linear: {rms_linear:.6f}")
+        print(f"  - dB: {rms_db:.2f} dB")
     
     # 4. Estimate tempo
-    tempo, confidence = estimate_tempo(audio, sample_rate)
-    if tempo > 0:
-        print(f"Tempo: {float(tempo):.1f} BPM (confidence: {float(confidence):.2f})")
-    else:
-        print("Tempo: Could not be estimated")
+    tempo, confidence = estimate_file_tempo(file_path, audio, sample_rate)
+    if verbose:
+        if tempo > 0:
+            print(f"Tempo: {float(tempo):.1f} BPM (confidence: {float(confidence):.2f})")
+        else:
+            print("Tempo: Could not be estimated")
     
     # 5. Detect clipping
     is_clipped, peak_level_db, clipping_threshold = detect_clipping(audio, sample_rate)
-    print(f"Clipping Detection:")
-    print(f"  - Peak level: {peak_level_db:.2f} dB")
-    print(f"  - Clipping threshold: {clipping_threshold:.2f} dB")
-    print(f"  - Likely clipped: {'YES' if is_clipped else 'NO'}")
-    
-    # Additional metrics
-    print(f"\nAdditional Metrics:")
-    print(f"  - Sample rate: {sample_rate} Hz")
-    print(f"  - Number of samples: {len(audio):,}")
-    print(f"  - Dynamic range: {peak_level_db - rms_db:.2f} dB")
-    
-    # 6. Generate mixing and mastering feedback
-    print(f"\n" + "=" * 50)
-    print("🎵 MIXING & MASTERING FEEDBACK")
-    print("=" * 50)
-    generate_mix_feedback(rms_db, peak_level_db, is_clipped, silence_periods, 
-                         tempo, duration, silence_percentage)
+    if verbose:
+        print(f"Clipping Detection:")
+        print(f"  - Peak level: {peak_level_db:.2f} dB")
+        print(f"  - Clipping threshold: {clipping_threshold:.2f} dB")
+        print(f"  - Likely clipped: {'YES' if is_clipped else 'NO'}")
+        
+        # Additional metrics
+        print(f"\nAdditional Metrics:")
+        print(f"  - Sample rate: {sample_rate} Hz")
+        print(f"  - Number of samples: {len(audio):,}")
+        print(f"  - Dynamic range: {peak_level_db - rms_db:.2f} dB")
+        
+        # 6. Generate mixing and mastering feedback
+        print(f"\n" + "=" * 50)
+        print("🎵 MIXING & MASTERING FEEDBACK")
+        print("=" * 50)
+        generate_mix_feedback(rms_db, peak_level_db, is_clipped, silence_periods, 
+                             tempo, duration, silence_percentage)
+    
+    metrics = {
+        'duration': duration,
+        'rms_db': float(rms_db),
+        'peak_db': float(peak_level_db),
+        'silence_percentage': silence_percentage,
+        'clipping': bool(is_clipped)
+    }
+    if tempo > 0:
+        metrics['tempo'] = float(tempo)
+    return metrics
 
 
 def main():
@@ -399,7 +477,6 @@ Examples:
     args = parser.parse_args()
     
     # Check if file exists
-    import os
     if not os.path.exists(args.audio_file):
         print(f"Error: File '{args.audio_file}' not found.")
         sys.exit(1)
@@ -5,10 +5,42 @@ This script helps identify potential causes of AxiosError
 """
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 import time
 from datetime import datetime
 
+def probe_url(session, url):
+    """Fetch ``url`` once and describe the outcome as a result row"""
+    try:
+        start_time = time.time()
+        response = session.get(url, timeout=10)
+        response_time = time.time() - start_time
+        
+        return {
+            "url": url,
+            "status_code": response.status_code,
+            "response_time": response_time,
+            "success": True
+        }
+        
+    except requests.exceptions.Timeout:
+        error = "Timeout"
+    except requests.exceptions.ConnectionError:
+        error = "Connection Error"
+    except Exception as e:
+        error = str(e)
+    
+    return {
+        "url": url,
+        "status_code": None,
+        "response_time": None,
+        "success": False,
+        "error": error
+    }
+
 def test_network_connectivity():
     """Test various network endpoints that might cause AxiosError"""
     
@@ -27,63 +59,39 @@ def test_network_connectivity():
     
     st.subheader("🌐 Network Connectivity Tests")
     
-    results = []
-    
-    for url in test_urls:
+    # Probe every endpoint at once so the whole test takes as long as the slowest one;
+    # one session keeps a connection pool per host for all of them
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=len(test_urls), pool_maxsize=len(test_urls))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with st.spinner("Running network tests..."):
+            with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+                results = list(executor.map(partial(probe_url, session), test_urls))
+    
+    for result in results:
         col1, col2, col3 = st.columns([2, 1, 1])
         
         with col1:
-            st.write(f"**{url}**")
+            st.write(f"**{result['url']}**")
         
         with col2:
-            try:
-                start_time = time.time()
-                response = requests.get(url, timeout=10)
-                response_time = time.time() - start_time
-                
-                if response.status_code == 200:
-                    st.success(f"✅ {response.status_code}")
+            if not result["success"]:
+                error = result["error"]
+                if error == "Timeout":
+                    st.error("⏰ Timeout")
+                elif error == "Connection Error":
+                    st.error("🔌 Connection Error")
                 else:
-                    st.warning(f"⚠️ {response.status_code}")
-                
-                results.append({
-                    "url": url,
-                    "status_code": response.status_code,
-                    "response_time": response_time,
-                    "success": True
-                })
-                
-            except requests.exceptions.Timeout:
-                st.error("⏰ Timeout")
-                results.append({
-                    "url": url,
-                    "status_code": None,
-                    "response_time": None,
-                    "success": False,
-                    "error": "Timeout"
-                })
-            except requests.exceptions.ConnectionError:
-                st.error("🔌 Connection Error")
-                results.append({
-                    "url": url,
-                    "status_code": None,
-                    "response_time": None,
-                    "success": False,
-                    "error": "Connection Error"
-                })
-            except Exception as e:
-                st.error(f"❌ {type(e).__name__}")
-                results.append({
-                    "url": url,
-                    "status_code": None,
-                    "response_time": None,
-                    "success": False,
-                    "error": str(e)
-                })
+                    st.error(f"❌ {error}")
+            elif result["status_code"] == 200:
+                st.success(f"✅ {result['status_code']}")
+            else:
+                st.warning(f"⚠️ {result['status_code']}")
         
         with col3:
-            if results and results[-1]["success"]:
-                st.write(f"{results[-1]['response_time']:.2f}s")
+            if result["success"]:
+                st.write(f"{result['response_time']:.2f}s")
             else:
                 st.write("N/A")
     
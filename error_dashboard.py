@@ -3,33 +3,209 @@
 Mixbot Error Dashboard
 Dashboard to view and analyze error logs from Mixbot
 """
+import os
+import threading
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pa_json
 import json
 from datetime import datetime, timedelta
-import plotly.express as px
 import plotly.graph_objects as go
 
-def load_error_data():
-    """Load error data from error_log.jsonl"""
-    errors = []
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+ERROR_FILE = "error_log.jsonl"
+
+# Columns the dashboard lists and filters on. Parsing against an explicit schema
+# lets pyarrow skip everything else in each record, including the free-form
+# ``error_details``, which is read back only for the error being inspected
+ERROR_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('us')),
+    ('error_type', pa.string()),
+    ('error_message', pa.string()),
+    ('user_context', pa.string()),
+    ('session_id', pa.string()),
+])
+ERROR_PARSE_OPTIONS = pa_json.ParseOptions(
+    explicit_schema=ERROR_SCHEMA,
+    unexpected_field_behavior="ignore"
+)
+
+# Repeated labels come out as categoricals; the free-text message stays a plain string
+CATEGORY_COLUMNS = ['error_type', 'user_context', 'session_id']
+
+# Bars in the error-type chart and entries in the context list; the rest are summed into "Other"
+TOP_LABELS = 20
+
+# Most points drawn in "Errors Over Time"; longer histories are summed into multi-day buckets
+TIMELINE_MAX_POINTS = 1500
+
+# Rows per page in the "Error Details" table
+DETAILS_PAGE_SIZE = 100
+
+# The log is parsed and scanned for line breaks this many bytes at a time
+BLOCK_SIZE = 8 << 20
+ERROR_READ_OPTIONS = pa_json.ReadOptions(block_size=BLOCK_SIZE)
+
+def _parse_records(chunk):
+    """Parse a buffer of complete JSON lines against ``ERROR_SCHEMA``"""
+    return pa_json.read_json(
+        pa.BufferReader(chunk),
+        read_options=ERROR_READ_OPTIONS,
+        parse_options=ERROR_PARSE_OPTIONS
+    )
+
+def _valid_lines(chunk, offsets):
+    """The non-blank lines of ``chunk`` that are JSON objects, and their ``offsets``"""
+    lines, kept = [], []
+    for line, offset in zip([line for line in chunk.to_pybytes().split(b"\n") if line], offsets):
+        try:
+            if line.strip() and isinstance(_json_loads(line), dict):
+                lines.append(line)
+                kept.append(offset)
+        except ValueError:
+            continue
+    return lines, np.array(kept, dtype=np.int64)
+
+def _parse_lines(lines, offsets):
+    """Parse ``lines`` against ``ERROR_SCHEMA``, dropping each line it rejects
+
+    A run of lines that fails is split in half until the offending lines are
+    isolated, so the lines around them are still parsed in bulk. Returns the
+    parsed tables and, for each, the offsets of its lines.
+    """
+    if not lines:
+        return [], []
     try:
-        with open("error_log.jsonl", "r") as f:
-            for line in f:
-                try:
-                    error_data = json.loads(line.strip())
-                    errors.append(error_data)
-                except json.JSONDecodeError:
-                    continue
+        return [_parse_records(b"\n".join(lines) + b"\n")], [offsets]
+    except pa.ArrowInvalid:
+        if len(lines) == 1:
+            return [], []
+    mid = len(lines) // 2
+    head_tables, head_offsets = _parse_lines(lines[:mid], offsets[:mid])
+    tail_tables, tail_offsets = _parse_lines(lines[mid:], offsets[mid:])
+    return head_tables + tail_tables, head_offsets + tail_offsets
+
+def _read_records(start=0):
+    """Parse the complete records in the error log from byte ``start`` on
+
+    Returns the records as a table with an ``offset`` column holding each
+    record's byte offset in the file, and the offset just past the last
+    complete record. A record still being written is left for the next read.
+    """
+    with pa.memory_map(ERROR_FILE) as source:
+        source.seek(start)
+        data = source.read_buffer()
+        raw = np.frombuffer(data, dtype=np.uint8)
+        newlines = np.concatenate([
+            np.flatnonzero(raw[i:i + BLOCK_SIZE] == 0x0A) + i
+            for i in range(0, max(raw.size, 1), BLOCK_SIZE)
+        ])
+        if not newlines.size:
+            return None, start
+        
+        line_starts = np.concatenate(([0], newlines[:-1] + 1))
+        # pyarrow skips blank lines, so only non-empty lines map to rows
+        offsets = start + line_starts[newlines > line_starts]
+        end = int(newlines[-1]) + 1
+        chunk = data.slice(0, end)
+        try:
+            table = _parse_records(chunk)
+        except pa.ArrowInvalid:
+            # Drop the lines that aren't JSON objects (e.g. a record cut short by a
+            # crash) or don't fit ERROR_SCHEMA, and parse the rest. The offset still
+            # moves past the dropped lines, so they aren't retried on every rerun
+            tables, kept = _parse_lines(*_valid_lines(chunk, offsets))
+            if not tables:
+                return None, start + end
+            table = pa.concat_tables(tables)
+            offsets = np.concatenate(kept)
+    
+    if table.num_rows != offsets.size:
+        # Whitespace-only lines; the offsets no longer line up with the rows
+        offsets = np.full(table.num_rows, -1)
+    return table.append_column('offset', pa.array(offsets, pa.int64())), start + end
+
+def load_error_details(offset):
+    """``error_details`` of the record at byte ``offset`` of the error log, or None"""
+    if offset < 0:
+        return None
+    with open(ERROR_FILE, "rb") as f:
+        f.seek(offset)
+        return _json_loads(f.readline()).get('error_details')
+
+def _mtime():
+    """Cache key for the error log: (mtime_ns, size), or None if it doesn't exist yet"""
+    try:
+        stat = os.stat(ERROR_FILE)
     except FileNotFoundError:
-        st.warning("No error log file found. Errors will appear here once they occur.")
-        return pd.DataFrame()
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource
+def _error_tail():
+    """Tables parsed so far from the append-only error log, shared across sessions"""
+    return {"offset": 0, "tables": [], "lock": threading.Lock()}
+
+def _read_new_records(tail):
+    """Parse only the records appended since the last read into ``tail["tables"]``"""
+    size = os.stat(ERROR_FILE).st_size
+    if size < tail["offset"]:
+        # File shrank (truncated or rotated) - start over
+        tail["offset"] = 0
+        tail["tables"] = []
+    if size == tail["offset"]:
+        return
     
-    if not errors:
-        st.success("🎉 No errors logged! Your app is running smoothly.")
+    table, end = _read_records(tail["offset"])
+    if table is not None and table.num_rows:
+        tail["tables"].append(table)
+    tail["offset"] = end
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def load_error_data(mtime):
+    """Load error data from error_log.jsonl
+
+    ``mtime`` is only the cache key - pass ``_mtime()`` so the log is
+    re-read whenever it changes and served from cache otherwise. Only the
+    newly appended tail of the log is parsed on each change, and only the
+    frame for the latest ``mtime`` is kept.
+    """
+    if mtime is None:
+        return None
+    
+    tail = _error_tail()
+    with tail["lock"]:
+        try:
+            _read_new_records(tail)
+        except FileNotFoundError:
+            return None
+        tables = list(tail["tables"])
+    
+    if not tables:
         return pd.DataFrame()
-    
-    return pd.DataFrame(errors)
+    # Records are appended roughly in time order; sorting them lets the dashboard
+    # count recent errors with a binary search
+    table = pa.concat_tables(tables).sort_by('timestamp')
+    return table.to_pandas(categories=CATEGORY_COLUMNS)
+
+def _label_counts(labels):
+    """value_counts() of a categorical column, without the categories filtered out of it"""
+    counts = labels.value_counts()
+    return counts[counts > 0]
+
+def _top_counts(counts, n=TOP_LABELS):
+    """The ``n`` largest of ``counts`` (sorted descending), with the rest summed into an "Other" entry"""
+    if len(counts) <= n:
+        return counts
+    return pd.concat([counts.iloc[:n], pd.Series({'Other': counts.iloc[n:].sum()})])
 
 def create_error_dashboard():
     """Create the error dashboard"""
@@ -43,14 +219,24 @@ def create_error_dashboard():
     st.markdown("Monitor and analyze errors from your Mixbot application")
     
     # Load error data
-    df = load_error_data()
+    try:
+        df = load_error_data(_mtime())
+    except pa.ArrowInvalid as e:
+        st.error(f"Could not parse the error log: {e}")
+        return
+    
+    if df is None:
+        st.warning("No error log file found. Errors will appear here once they occur.")
+        return
     
     if df.empty:
+        st.success("🎉 No errors logged! Your app is running smoothly.")
         return
     
-    # Convert timestamp to datetime
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df['date'] = df['timestamp'].dt.date
+    # Timestamps are parsed as datetimes while loading; truncate them to whole
+    # days in one cast instead of building a Python date object per row
+    df['date'] = df['timestamp'].values.astype('datetime64[D]')
+    first_day, last_day = df['date'].min().date(), df['date'].max().date()
     
     # Sidebar filters
     st.sidebar.header("🔍 Filters")
@@ -58,33 +244,36 @@ def create_error_dashboard():
     # Date range filter
     date_range = st.sidebar.date_input(
         "Date Range",
-        value=(df['date'].min(), df['date'].max()),
-        min_value=df['date'].min(),
-        max_value=df['date'].max()
+        value=(first_day, last_day),
+        min_value=first_day,
+        max_value=last_day
     )
     
     # Error type filter
-    error_types = ['All'] + list(df['error_type'].unique())
+    error_types = ['All'] + df['error_type'].cat.categories.tolist()
     selected_error_type = st.sidebar.selectbox("Error Type", error_types)
     
     # User context filter
-    contexts = ['All'] + list(df['user_context'].dropna().unique())
+    contexts = ['All'] + df['user_context'].cat.categories.tolist()
     selected_context = st.sidebar.selectbox("User Context", contexts)
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as one combined mask; labels are matched on their category codes
+    mask = np.ones(len(df), dtype=bool)
     
     if len(date_range) == 2:
-        filtered_df = filtered_df[
-            (filtered_df['date'] >= date_range[0]) & 
-            (filtered_df['date'] <= date_range[1])
-        ]
+        dates = df['date'].values
+        mask &= (dates >= np.datetime64(date_range[0])) & (dates <= np.datetime64(date_range[1]))
     
     if selected_error_type != 'All':
-        filtered_df = filtered_df[filtered_df['error_type'] == selected_error_type]
+        mask &= df['error_type'].cat.codes.values == df['error_type'].cat.categories.get_loc(selected_error_type)
     
     if selected_context != 'All':
-        filtered_df = filtered_df[filtered_df['user_context'] == selected_context]
+        mask &= df['user_context'].cat.codes.values == df['user_context'].cat.categories.get_loc(selected_context)
+    
+    filtered_df = df[mask]
+    
+    # Per-type counts, shared by the metrics, the bar chart, the insights and the recommendations
+    error_counts = _label_counts(filtered_df['error_type'])
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -93,69 +282,84 @@ def create_error_dashboard():
         st.metric("Total Errors", len(filtered_df))
     
     with col2:
-        st.metric("Unique Error Types", filtered_df['error_type'].nunique())
+        st.metric("Unique Error Types", len(error_counts))
     
     with col3:
         st.metric("Affected Sessions", filtered_df['session_id'].nunique())
     
     with col4:
-        if len(filtered_df) > 0:
-            recent_errors = filtered_df[filtered_df['timestamp'] > datetime.now() - timedelta(hours=24)]
-            st.metric("Last 24h Errors", len(recent_errors))
-        else:
-            st.metric("Last 24h Errors", 0)
+        # Timestamps are sorted on load, so the last 24h are a suffix of the
+        # timestamped rows; missing timestamps sort after them and never count
+        cutoff = np.datetime64(datetime.now() - timedelta(hours=24))
+        timestamps = filtered_df['timestamp'].values
+        timestamps = timestamps[:len(timestamps) - np.count_nonzero(np.isnat(timestamps))]
+        recent_start = np.searchsorted(timestamps, cutoff, side='right')
+        st.metric("Last 24h Errors", len(timestamps) - recent_start)
     
     # Charts
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📊 Errors by Type")
-        error_counts = filtered_df['error_type'].value_counts()
-        fig_errors = px.bar(
-            x=error_counts.index, 
-            y=error_counts.values,
-            title="Error Type Distribution"
-        )
-        fig_errors.update_layout(xaxis_title="Error Type", yaxis_title="Count")
+        top_types = _top_counts(error_counts)
+        # Plain graph_objects; plotly.express costs tens of ms per chart on every rerun
+        fig_errors = go.Figure(go.Bar(x=top_types.index, y=top_types.values))
+        fig_errors.update_layout(title="Error Type Distribution", xaxis_title="Error Type", yaxis_title="Count")
         st.plotly_chart(fig_errors, use_container_width=True)
     
     with col2:
         st.subheader("📈 Errors Over Time")
-        daily_errors = filtered_df.groupby('date').size().reset_index(name='count')
-        fig_timeline = px.line(
-            daily_errors, 
-            x='date', 
-            y='count',
-            title="Daily Error Count"
-        )
-        fig_timeline.update_layout(xaxis_title="Date", yaxis_title="Error Count")
+        # Sum power-of-two runs of days once the history is longer than the chart has room for
+        bucket_days = 1
+        while (last_day - first_day).days >= bucket_days * TIMELINE_MAX_POINTS:
+            bucket_days *= 2
+        if bucket_days == 1:
+            daily_errors = filtered_df.groupby('date').size()
+            title = "Daily Error Count"
+        else:
+            buckets = filtered_df['date'].dt.floor(f'{bucket_days}D')
+            daily_errors = filtered_df.groupby(buckets).size()
+            title = f"Error Count per {bucket_days} Days"
+        fig_timeline = go.Figure(go.Scatter(x=daily_errors.index, y=daily_errors.values, mode='lines'))
+        fig_timeline.update_layout(title=title, xaxis_title="Date", yaxis_title="Error Count")
         st.plotly_chart(fig_timeline, use_container_width=True)
     
     # Error details table
     st.subheader("🔍 Error Details")
     
+    # Only the current page is formatted and sent to the browser
+    pages = max(1, -(-len(filtered_df) // DETAILS_PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=pages, value=pages)
+    start = (page - 1) * DETAILS_PAGE_SIZE
+    
+    page_df = filtered_df.iloc[start:start + DETAILS_PAGE_SIZE]
+    
     # Create a more readable table
-    display_df = filtered_df[['timestamp', 'error_type', 'error_message', 'user_context', 'session_id']].copy()
+    display_df = page_df[['timestamp', 'error_type', 'error_message', 'user_context', 'session_id']].copy()
     display_df['timestamp'] = display_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
     display_df['error_message'] = display_df['error_message'].str[:100] + '...'  # Truncate long messages
     
     # Rename columns for display
     display_df.columns = ['Timestamp', 'Error Type', 'Error Message', 'Context', 'Session ID']
     
+    st.caption(f"Rows {start + 1}-{start + len(display_df)} of {len(filtered_df)}")
     st.dataframe(display_df, use_container_width=True)
     
-    # Detailed error view
-    if len(filtered_df) > 0:
+    # Detailed error view, offering the errors on the current page with the labels formatted above
+    if len(page_df) > 0:
         st.subheader("📋 Detailed Error Information")
         
+        labels = (display_df['Timestamp'] + ' - ' + display_df['Error Type'].astype(str)).tolist()
         selected_error = st.selectbox(
-            "Select an error to view details:",
-            range(len(filtered_df)),
-            format_func=lambda x: f"{filtered_df.iloc[x]['timestamp'].strftime('%Y-%m-%d %H:%M:%S')} - {filtered_df.iloc[x]['error_type']}"
+            "Select an error on this page to view details:",
+            range(len(labels)),
+            format_func=labels.__getitem__
         )
         
         if selected_error is not None:
-            error = filtered_df.iloc[selected_error]
+            error = page_df.iloc[selected_error]
+            # Missing labels come back from the categorical columns as NaN; show them as null
+            error = error.where(error.notna(), None)
             
             col1, col2 = st.columns(2)
             
@@ -171,8 +375,9 @@ def create_error_dashboard():
             
             with col2:
                 st.markdown("**Error Details:**")
-                if error['error_details']:
-                    st.json(error['error_details'])
+                error_details = load_error_details(error['offset'])
+                if error_details:
+                    st.json(error_details)
                 else:
                     st.info("No additional details available")
     
@@ -183,13 +388,13 @@ def create_error_dashboard():
     
     with col1:
         st.markdown("**Most Common Error Types:**")
-        top_errors = filtered_df['error_type'].value_counts().head(5)
+        top_errors = error_counts.head(5)
         for error_type, count in top_errors.items():
             st.markdown(f"- **{error_type}**: {count} occurrences")
     
     with col2:
         st.markdown("**Error Contexts:**")
-        context_counts = filtered_df['user_context'].value_counts()
+        context_counts = _top_counts(_label_counts(filtered_df['user_context']))
         for context, count in context_counts.items():
             if pd.notna(context):
                 st.markdown(f"- **{context}**: {count} errors")
@@ -198,24 +403,25 @@ def create_error_dashboard():
     st.subheader("🛠️ Recommendations")
     
     if len(filtered_df) > 0:
-        # Analyze error patterns
-        file_errors = filtered_df[filtered_df['error_type'].str.contains('file', case=False)]
-        analysis_errors = filtered_df[filtered_df['error_type'].str.contains('analysis', case=False)]
-        ui_errors = filtered_df[filtered_df['error_type'].str.contains('ui', case=False)]
+        # Analyze error patterns over the distinct error types seen rather than every row
+        seen_types = error_counts.index
+        has_file_errors = seen_types.str.contains('file', case=False).any()
+        has_analysis_errors = seen_types.str.contains('analysis', case=False).any()
+        has_ui_errors = seen_types.str.contains('ui', case=False).any()
         
-        if len(file_errors) > 0:
+        if has_file_errors:
             st.warning("**File Processing Issues Detected:**")
             st.markdown("- Consider adding file validation")
             st.markdown("- Check file size limits")
             st.markdown("- Verify supported file formats")
         
-        if len(analysis_errors) > 0:
+        if has_analysis_errors:
             st.warning("**Analysis Issues Detected:**")
             st.markdown("- Review audio processing pipeline")
             st.markdown("- Check librosa/soundfile dependencies")
             st.markdown("- Consider adding fallback analysis methods")
         
-        if len(ui_errors) > 0:
+        if has_ui_errors:
             st.warning("**UI Issues Detected:**")
             st.markdown("- Review Streamlit component interactions")
             st.markdown("- Check session state management")
@@ -0,0 +1,763 @@
+#!/usr/bin/env python3
+"""
+Mixbot Feedback Tables
+
+DAW plugin recommendations and genre rules used to build mix feedback.
+Kept out of app.py so the tables are built once at import instead of on
+every Streamlit rerun.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
+# DAW-specific plugin recommendations, keyed by the DAW names offered in the app.
+# Each DAW's table is read-only as well, so callers can share it without copying
+DAW_PLUGINS = MappingProxyType({daw: MappingProxyType(plugins) for daw, plugins in {
+    "FL Studio": {
+        "eq": """
+- **Fruity Parametric EQ 2**: Surgical EQ with spectrum analyzer
+- **Fruity Filter**: High-pass/low-pass filtering
+- **Maximus**: Multiband compression and limiting
+- **Fruity Limiter**: Peak limiting and compression
+- **Fruity Reverb 2**: Convolution reverb
+- **Fruity Delay 3**: Stereo delay with sync
+- **Fruity Distortion**: Saturation and distortion
+- **Fruity Compressor**: Classic compression
+- **Fruity Stereo Enhancer**: Stereo width
+- **Fruity Chorus**: Modulation effects""",
+        
+        "third_party": """
+- **FabFilter Pro-Q 3**: Professional parametric EQ
+- **Waves SSL E-Channel**: Console-style EQ and compression
+- **iZotope Ozone**: Mastering suite
+- **Valhalla Room**: Algorithmic reverb
+- **Soundtoys EchoBoy**: Vintage delay emulation
+- **Waves CLA-76**: 1176-style compression
+- **FabFilter Pro-C 2**: Professional compression
+- **iZotope Neutron**: Mixing assistant
+- **Waves H-Delay**: Stereo delay
+- **Soundtoys Decapitator**: Saturation and distortion""",
+        
+        "compression": """
+- **Fruity Compressor**: Classic compression with visual feedback
+- **Maximus**: Multiband compression and limiting
+- **Fruity Limiter**: Peak limiting and compression
+- **Fruity Multiband Compressor**: Frequency-specific compression
+- **Fruity Peak Controller**: Side-chain compression
+- **Fruity Balance**: Volume automation
+- **Fruity Formula Controller**: Custom compression curves""",
+        
+        "expansion": """
+- **Fruity Compressor**: Use in expansion mode
+- **Fruity Peak Controller**: Dynamic expansion
+- **Fruity Formula Controller**: Custom expansion curves
+- **Fruity Balance**: Volume automation for expansion""",
+        
+        "effects": """
+- **Fruity Reverb 2**: Convolution reverb with presets
+- **Fruity Delay 3**: Stereo delay with tempo sync
+- **Fruity Chorus**: Modulation and chorus effects
+- **Fruity Flangus**: Flanger and phaser effects
+- **Fruity Distortion**: Saturation and distortion
+- **Fruity Stereo Enhancer**: Stereo width and enhancement
+- **Fruity Phaser**: Phase shifting effects
+- **Fruity Delay Bank**: Multiple delay lines
+- **Fruity Reeverb 2**: Algorithmic reverb
+- **Fruity Convolver**: Convolution effects"""
+    },
+    
+    "Ableton Live": {
+        "eq": """
+- **EQ Eight**: 8-band parametric EQ with spectrum
+- **EQ Three**: Simple 3-band EQ for quick adjustments
+- **Auto Filter**: Auto-wah and filter effects
+- **Multiband Dynamics**: Multiband compression
+- **Utility**: Stereo width and phase adjustment
+- **Spectrum**: Real-time spectrum analyzer
+- **Tuner**: Pitch detection and tuning
+- **Frequency Shifter**: Frequency manipulation""",
+        
+        "compression": """
+- **Compressor**: Classic compression with visual feedback
+- **Glue Compressor**: SSL-style bus compression
+- **Multiband Dynamics**: Frequency-specific compression
+- **Limiter**: Peak limiting and clipping prevention
+- **Gate**: Noise gate and expansion
+- **Drum Buss**: Drum-specific compression and saturation
+- **Dynamic Tube**: Tube saturation and compression""",
+        
+        "expansion": """
+- **Gate**: Noise gate and expansion
+- **Multiband Dynamics**: Expansion in specific frequency bands
+- **Compressor**: Use in expansion mode
+- **Dynamic Tube**: Tube expansion effects""",
+        
+        "effects": """
+- **Reverb**: Algorithmic reverb with multiple algorithms
+- **Delay**: Stereo delay with tempo sync
+- **Echo**: Vintage delay emulation
+- **Chorus**: Modulation and chorus effects
+- **Flanger**: Flanging effects
+- **Phaser**: Phase shifting effects
+- **Auto Pan**: Automatic panning
+- **Auto Filter**: Auto-wah and filter effects
+- **Saturator**: Saturation and distortion
+- **Overdrive**: Overdrive effects""",
+        
+        "third_party": """
+- **FabFilter Pro-Q 3**: Professional parametric EQ
+- **Waves SSL E-Channel**: Console-style EQ and compression
+- **iZotope Ozone**: Mastering suite
+- **Valhalla Room**: Algorithmic reverb
+- **Soundtoys EchoBoy**: Vintage delay emulation
+- **Waves CLA-76**: 1176-style compression
+- **FabFilter Pro-C 2**: Professional compression
+- **iZotope Neutron**: Mixing assistant
+- **Waves H-Delay**: Stereo delay
+- **Soundtoys Decapitator**: Saturation and distortion"""
+    },
+    
+    "Logic Pro": {
+        "eq": """
+- **Channel EQ**: 8-band parametric EQ with spectrum
+- **Linear Phase EQ**: Phase-corrected EQ
+- **Match EQ**: Match frequency response of reference
+- **Single Band EQ**: Simple single-band EQ
+- **Fat EQ**: Vintage EQ emulation
+- **Vintage Console EQ**: Console-style EQ
+- **Vintage Graphic EQ**: Graphic EQ emulation
+- **Spectrum Analyzer**: Real-time spectrum display""",
+        
+        "compression": """
+- **Compressor**: Classic compression with multiple algorithms
+- **Vintage FET Compressor**: 1176-style compression
+- **Vintage VCA Compressor**: SSL-style compression
+- **Vintage Opto Compressor**: LA-2A-style compression
+- **Multipressor**: Multiband compression
+- **Adaptive Limiter**: Peak limiting and clipping prevention
+- **Enveloper**: Envelope-based compression
+- **Dynamics Processor**: Advanced dynamics control""",
+        
+        "expansion": """
+- **Noise Gate**: Noise gate and expansion
+- **Enveloper**: Envelope-based expansion
+- **Dynamics Processor**: Advanced expansion control
+- **Compressor**: Use in expansion mode""",
+        
+        "effects": """
+- **Space Designer**: Convolution reverb
+- **ChromaVerb**: Algorithmic reverb
+- **Stereo Delay**: Stereo delay with tempo sync
+- **Tape Delay**: Vintage delay emulation
+- **Chorus**: Modulation and chorus effects
+- **Flanger**: Flanging effects
+- **Phaser**: Phase shifting effects
+- **Tremolo**: Tremolo effects
+- **Distortion**: Distortion and saturation
+- **Bitcrusher**: Bit reduction and sample rate effects"""
+    },
+    
+    "Pro Tools": {
+        "eq": """
+- **EQ3**: 7-band parametric EQ
+- **EQ7**: 7-band parametric EQ with spectrum
+- **Channel Strip**: Console-style EQ and dynamics
+- **DigiRack EQ**: Classic Pro Tools EQ
+- **BF-2A**: Pultec-style EQ
+- **BF-3A**: 3-band parametric EQ
+- **BF-76**: 1176-style compressor with EQ
+- **BF-2A**: LA-2A-style compressor with EQ""",
+        
+        "compression": """
+- **Dyn3 Compressor**: Classic compression
+- **Dyn3 Compressor/Limiter**: Compression and limiting
+- **Dyn3 Expander/Gate**: Expansion and gating
+- **Channel Strip**: Console-style compression
+- **BF-76**: 1176-style compression
+- **BF-2A**: LA-2A-style compression
+- **BF-3A**: 3-band compression
+- **Multiband Dynamics**: Frequency-specific compression""",
+        
+        "expansion": """
+- **Dyn3 Expander/Gate**: Expansion and gating
+- **Channel Strip**: Console-style expansion
+- **BF-3A**: 3-band expansion
+- **Multiband Dynamics**: Frequency-specific expansion""",
+        
+        "effects": """
+- **D-Verb**: Algorithmic reverb
+- **Space**: Convolution reverb
+- **Mod Delay III**: Stereo delay with modulation
+- **Long Delay III**: Long delay effects
+- **Short Delay III**: Short delay effects
+- **Flanger**: Flanging effects
+- **Chorus**: Chorus effects
+- **Phaser**: Phase shifting effects
+- **Lo-Fi**: Bit reduction and sample rate effects
+- **SansAmp**: Amp simulation and distortion"""
+    },
+    
+    "Cubase": {
+        "eq": """
+- **Frequency**: 8-band parametric EQ
+- **StudioEQ**: Professional parametric EQ
+- **GEQ-30**: 30-band graphic EQ
+- **VST Amp Rack**: Amp simulation with EQ
+- **Multiband Compressor**: Multiband compression with EQ
+- **Channel Strip**: Console-style EQ and dynamics
+- **Spectrum Analyzer**: Real-time spectrum display""",
+        
+        "compression": """
+- **Compressor**: Classic compression
+- **Multiband Compressor**: Frequency-specific compression
+- **Tube Compressor**: Tube compression emulation
+- **Vintage Compressor**: Vintage compression emulation
+- **Limiter**: Peak limiting
+- **Gate**: Noise gate and expansion
+- **Envelope Shaper**: Envelope-based compression""",
+        
+        "expansion": """
+- **Gate**: Noise gate and expansion
+- **Envelope Shaper**: Envelope-based expansion
+- **Multiband Compressor**: Frequency-specific expansion
+- **Compressor**: Use in expansion mode""",
+        
+        "effects": """
+- **Reverb**: Algorithmic reverb
+- **Roomworks**: Room simulation
+- **REVerence**: Convolution reverb
+- **Delay**: Stereo delay with tempo sync
+- **ModMachine**: Modulation effects
+- **Chorus**: Chorus effects
+- **Flanger**: Flanging effects
+- **Phaser**: Phase shifting effects
+- **Distortion**: Distortion and saturation
+- **Bitcrusher**: Bit reduction effects"""
+    },
+    
+    "Reaper": {
+        "eq": """
+- **ReaEQ**: Parametric EQ with spectrum
+- **ReaFir**: Linear phase EQ and spectrum analyzer
+- **ReaXcomp**: Multiband compression with EQ
+- **ReaComp**: Compression with side-chain EQ
+- **JS: Graphic EQ**: Graphic EQ
+- **JS: 3-Band EQ**: Simple 3-band EQ
+- **JS: 5-Band EQ**: Simple 5-band EQ
+- **JS: 7-Band EQ**: Simple 7-band EQ""",
+        
+        "compression": """
+- **ReaComp**: Classic compression with side-chain
+- **ReaXcomp**: Multiband compression
+- **ReaGate**: Noise gate and expansion
+- **ReaLimit**: Peak limiting
+- **JS: Compressor**: Simple compression
+- **JS: Limiter**: Simple limiting
+- **JS: Gate**: Simple gating
+- **JS: Multiband Compressor**: Multiband compression""",
+        
+        "expansion": """
+- **ReaGate**: Noise gate and expansion
+- **JS: Gate**: Simple gating and expansion
+- **ReaComp**: Use in expansion mode
+- **JS: Compressor**: Use in expansion mode""",
+        
+        "effects": """
+- **ReaVerb**: Convolution reverb
+- **ReaDelay**: Stereo delay with tempo sync
+- **ReaChorus**: Chorus effects
+- **ReaFlanger**: Flanging effects
+- **ReaPhaser**: Phase shifting effects
+- **ReaTune**: Pitch correction
+- **ReaPitch**: Pitch shifting
+- **JS: Reverb**: Simple reverb
+- **JS: Delay**: Simple delay
+- **JS: Chorus**: Simple chorus"""
+    },
+    
+    "Studio One": {
+        "eq": """
+- **Pro EQ**: Professional parametric EQ
+- **Splitter**: Multiband processing with EQ
+- **Channel Strip**: Console-style EQ and dynamics
+- **Mix Tool**: Simple EQ and dynamics
+- **Tone Generator**: Test tone generator
+- **Spectrum Meter**: Real-time spectrum display
+- **VU Meter**: VU metering
+- **Phase Meter**: Phase correlation meter""",
+        
+        "compression": """
+- **Compressor**: Classic compression
+- **Multiband Dynamics**: Multiband compression
+- **Channel Strip**: Console-style compression
+- **Mix Tool**: Simple compression
+- **Limiter**: Peak limiting
+- **Gate**: Noise gate and expansion
+- **Envelope Shaper**: Envelope-based compression
+- **Splitter**: Multiband processing""",
+        
+        "expansion": """
+- **Gate**: Noise gate and expansion
+- **Envelope Shaper**: Envelope-based expansion
+- **Multiband Dynamics**: Frequency-specific expansion
+- **Splitter**: Multiband processing for expansion""",
+        
+        "effects": """
+- **Room Reverb**: Algorithmic reverb
+- **Open Air**: Convolution reverb
+- **Delay**: Stereo delay with tempo sync
+- **Chorus**: Chorus effects
+- **Flanger**: Flanging effects
+- **Phaser**: Phase shifting effects
+- **Tremolo**: Tremolo effects
+- **Distortion**: Distortion and saturation
+- **Bitcrusher**: Bit reduction effects
+- **Mix Tool**: Simple effects processing"""
+    },
+    
+    "Bitwig Studio": {
+        "eq": """
+- **EQ+**: Parametric EQ with spectrum
+- **EQ-5**: 5-band parametric EQ
+- **Multiband**: Multiband processing with EQ
+- **Channel EQ**: Console-style EQ
+- **Spectrum**: Real-time spectrum analyzer
+- **Tuner**: Pitch detection and tuning
+- **Frequency Shifter**: Frequency manipulation
+- **Resonator**: Resonant filter effects""",
+        
+        "compression": """
+- **Compressor**: Classic compression
+- **Multiband**: Multiband compression
+- **Limiter**: Peak limiting
+- **Gate**: Noise gate and expansion
+- **Transient**: Transient shaping
+- **Channel**: Console-style compression
+- **Dynamics**: Advanced dynamics control
+- **Sidechain**: Side-chain compression""",
+        
+        "expansion": """
+- **Gate**: Noise gate and expansion
+- **Transient**: Transient expansion
+- **Dynamics**: Advanced expansion control
+- **Multiband**: Frequency-specific expansion""",
+        
+        "effects": """
+- **Reverb**: Algorithmic reverb
+- **Delay**: Stereo delay with tempo sync
+- **Chorus**: Chorus effects
+- **Flanger**: Flanging effects
+- **Phaser**: Phase shifting effects
+- **Tremolo**: Tremolo effects
+- **Distortion**: Distortion and saturation
+- **Bitcrusher**: Bit reduction effects
+- **Resonator**: Resonant filter effects
+- **Frequency Shifter**: Frequency manipulation"""
+    },
+    
+    "Serato DJ Pro": {
+        "eq": """
+- **3-Band EQ**: High, mid, low frequency control
+- **Filter**: High-pass and low-pass filters
+- **FX Units**: Reverb, delay, echo, flanger
+- **Sample Player**: Trigger samples and loops
+- **Pitch Control**: Key and tempo adjustment
+- **Auto Gain**: Automatic level matching
+- **Isolator**: Cut frequencies completely""",
+        
+        "compression": """
+- **Auto Gain**: Automatic level matching between tracks
+- **Limiter**: Prevent clipping during transitions
+- **Compressor**: Control dynamic range
+- **Gate**: Reduce unwanted noise
+- **Level Matching**: Consistent track levels""",
+        
+        "expansion": """
+- **Gate**: Reduce noise and unwanted sounds
+- **Auto Gain**: Dynamic level adjustment
+- **Filter**: Frequency-based expansion""",
+        
+        "effects": """
+- **Reverb**: Add space and atmosphere
+- **Delay**: Create rhythmic effects
+- **Echo**: Classic DJ echo effect
+- **Flanger**: Modulate frequency
+- **Filter**: Sweep frequencies for transitions
+- **Phaser**: Phase shifting effects
+- **Chorus**: Modulation effects
+- **Distortion**: Add grit and character""",
+        
+        "third_party": """
+- **Serato DJ Pro**: Professional DJ software
+- **Serato Sample**: Sample triggering and manipulation
+- **Serato FX**: Advanced effects processing
+- **Serato Pitch 'n Time**: Advanced pitch and tempo control
+- **Serato Video**: Video mixing capabilities"""
+    },
+    
+    "Rekordbox": {
+        "eq": """
+- **3-Band EQ**: High, mid, low control
+- **Isolator**: Cut frequencies completely
+- **Filter**: High-pass and low-pass
+- **Color FX**: Frequency-based effects
+- **Beat FX**: Tempo-synced effects
+- **Auto Gain**: Match track levels
+- **Quantize**: Beat-synced effects""",
+        
+        "compression": """
+- **Auto Gain**: Match track levels automatically
+- **Limiter**: Prevent distortion
+- **Compressor**: Control dynamics
+- **Gate**: Noise reduction
+- **Level Matching**: Consistent levels across tracks""",
+        
+        "expansion": """
+- **Gate**: Noise reduction and expansion
+- **Auto Gain**: Dynamic level adjustment
+- **Filter**: Frequency-based expansion""",
+        
+        "effects": """
+- **Reverb**: Add space and atmosphere
+- **Delay**: Create rhythmic effects
+- **Echo**: Classic DJ echo
+- **Flanger**: Modulate frequency
+- **Filter**: Sweep frequencies
+- **Phaser**: Phase shifting
+- **Chorus**: Modulation effects
+- **Distortion**: Add character""",
+        
+        "third_party": """
+- **Rekordbox**: Pioneer's professional DJ software
+- **Pioneer CDJs**: Hardware integration
+- **Pioneer DJM Mixers**: Hardware effects
+- **Rekordbox Video**: Video mixing capabilities"""
+    },
+    
+    "Traktor Pro": {
+        "eq": """
+- **3-Band EQ**: High, mid, low control
+- **Filter**: High-pass and low-pass
+- **FX Units**: Advanced effects processing
+- **Remix Decks**: Sample triggering
+- **Stems**: Multitrack mixing
+- **Auto Gain**: Level matching
+- **Isolator**: Frequency cutting""",
+        
+        "compression": """
+- **Auto Gain**: Automatic level matching
+- **Limiter**: Prevent clipping
+- **Compressor**: Dynamic control
+- **Gate**: Noise reduction
+- **Level Matching**: Consistent levels""",
+        
+        "expansion": """
+- **Gate**: Noise reduction and expansion
+- **Auto Gain**: Dynamic level adjustment
+- **Filter**: Frequency-based expansion""",
+        
+        "effects": """
+- **Reverb**: Add space and atmosphere
+- **Delay**: Create rhythmic effects
+- **Echo**: Classic DJ echo
+- **Flanger**: Modulate frequency
+- **Filter**: Sweep frequencies
+- **Phaser**: Phase shifting
+- **Chorus**: Modulation effects
+- **Distortion**: Add character
+- **Remix Decks**: Sample manipulation""",
+        
+        "third_party": """
+- **Traktor Pro**: Native Instruments DJ software
+- **Traktor Kontrol**: Hardware controllers
+- **Traktor Audio**: Audio interfaces
+- **Traktor Stems**: Multitrack mixing"""
+    },
+    
+    "Virtual DJ": {
+        "eq": """
+- **3-Band EQ**: High, mid, low control
+- **Filter**: High-pass and low-pass
+- **FX Units**: Effects processing
+- **Auto Gain**: Level matching
+- **Isolator**: Frequency cutting
+- **Spectrum**: Real-time analyzer
+- **Pitch Control**: Tempo and key adjustment""",
+        
+        "compression": """
+- **Auto Gain**: Automatic level matching
+- **Limiter**: Prevent clipping
+- **Compressor**: Dynamic control
+- **Gate**: Noise reduction
+- **Level Matching**: Consistent levels""",
+        
+        "expansion": """
+- **Gate**: Noise reduction and expansion
+- **Auto Gain**: Dynamic level adjustment
+- **Filter**: Frequency-based expansion""",
+        
+        "effects": """
+- **Reverb**: Add space and atmosphere
+- **Delay**: Create rhythmic effects
+- **Echo**: Classic DJ echo
+- **Flanger**: Modulate frequency
+- **Filter**: Sweep frequencies
+- **Phaser**: Phase shifting
+- **Chorus**: Modulation effects
+- **Distortion**: Add character
+- **Video Mixing**: Video effects""",
+        
+        "third_party": """
+- **Virtual DJ**: Affordable DJ software
+- **Virtual DJ Pro**: Professional features
+- **Virtual DJ Video**: Video mixing capabilities
+- **Virtual DJ Karaoke**: Karaoke features"""
+    }
+}.items()})
+
+# Recommendations for DAWs not in DAW_PLUGINS
+DEFAULT_PLUGINS = MappingProxyType({
+    "eq": "- Use built-in EQ plugins for your DAW",
+    "compression": "- Use built-in compression plugins for your DAW", 
+    "expansion": "- Use built-in expansion plugins for your DAW",
+    "effects": "- Use built-in effects plugins for your DAW",
+    "third_party": "- Consider professional third-party plugins for your DAW"
+})
+
+# Genre-specific EQ and compression advice for the feedback report; genres
+# without an entry get the GENERAL_* text
+EQ_ADVICE_BY_GENRE = MappingProxyType({
+    'Hip-Hop/Rap': """
+**Hip-Hop/Rap EQ Focus:**
+- **Bass (60-120 Hz)**: Boost for heavy, punchy bass
+- **Kick (80-100 Hz)**: Cut competing frequencies in other tracks
+- **Vocals (2-4 kHz)**: Boost for clarity and presence
+- **Highs (8-12 kHz)**: High-shelf for brightness and air
+- **Low-Mid Cuts**: Cut 200-400 Hz in non-essential tracks to reduce mud
+""",
+    'Electronic/Dance': """
+**Electronic/Dance EQ Focus:**
+- **Kick (60-80 Hz)**: Boost for punch and dance floor impact
+- **Bass (100-200 Hz)**: Tight, controlled bass
+- **Highs (10-15 kHz)**: Bright, energetic highs
+- **Mid Cuts**: Cut 400-800 Hz to reduce boxiness
+- **Stereo Width**: Enhance 8-12 kHz for wide, open sound
+""",
+    'Rock': """
+**Rock EQ Focus:**
+- **Guitars (2-4 kHz)**: Boost for presence and cut-through
+- **Drums (80-120 Hz)**: Punchy, natural drum sound
+- **Vocals (3-5 kHz)**: Clear, forward vocals
+- **Bass (100-200 Hz)**: Warm, supporting bass
+- **Highs (8-12 kHz)**: Natural brightness without harshness
+""",
+    'Pop': """
+**Pop EQ Focus:**
+- **Vocals (2-5 kHz)**: Forward, clear vocals
+- **Bass (80-150 Hz)**: Tight, controlled bass
+- **Highs (10-15 kHz)**: Bright, radio-friendly highs
+- **Mid Cuts**: Cut 300-600 Hz to reduce mud
+- **Stereo Width**: Wide, open mix
+"""
+})
+GENERAL_EQ_ADVICE = """
+**General EQ Focus:**
+- **High-Pass Filter**: Apply at 20-30 Hz to remove rumble
+- **Low-Mid Cuts**: Cut 200-400 Hz if mix sounds muddy
+- **Presence Boost**: Boost 2-4 kHz for clarity and definition
+- **Air Frequencies**: High-shelf 8-12 kHz for brightness
+"""
+
+COMP_ADVICE_BY_GENRE = MappingProxyType({
+    'Hip-Hop/Rap': """
+**Hip-Hop/Rap Compression:**
+- **Aggressive compression** on drums for punch
+- **Side-chain compression** on bass from kick
+- **Parallel compression** on vocals for thickness
+- **Multiband compression** on master for control
+- **Attack: 5-15ms, Release: 50-150ms** for punchy sound
+""",
+    'Electronic/Dance': """
+**Electronic/Dance Compression:**
+- **Tight compression** on kick and bass
+- **Side-chain compression** for pumping effect
+- **Parallel compression** on drums for impact
+- **Multiband compression** for frequency control
+- **Attack: 1-10ms, Release: 30-100ms** for tight sound
+""",
+    'Rock': """
+**Rock Compression:**
+- **Moderate compression** on guitars and vocals
+- **Natural compression** on drums
+- **Parallel compression** for thickness
+- **Bus compression** for glue
+- **Attack: 10-30ms, Release: 100-300ms** for natural sound
+""",
+    'Pop': """
+**Pop Compression:**
+- **Consistent compression** on vocals
+- **Tight compression** on drums
+- **Parallel compression** for thickness
+- **Bus compression** for consistency
+- **Attack: 5-20ms, Release: 50-200ms** for consistent sound
+"""
+})
+GENERAL_COMP_ADVICE = """
+**General Compression:**
+- **Gentle compression** on individual tracks
+- **Parallel compression** for thickness
+- **Side-chain compression** to create space
+- **Multiband compression** for complex material
+- **Attack: 10-30ms, Release: 100-300ms**
+"""
+
+# Overall energy verdict by genre: RMS (dB) band boundaries, then a
+# (description, emoji) for each band from quietest to loudest
+ENERGY_BANDS_BY_GENRE = MappingProxyType({
+    'Hip-Hop/Rap': ((-15, -10), (
+        ("needs more punch for hip-hop", "❌"),
+        ("has good hip-hop energy", "✅"),
+        ("is well-mixed for hip-hop", "🎵"),
+    )),
+    'Electronic/Dance': ((-12, -8), (
+        ("needs more energy for dance music", "❌"),
+        ("has good dance floor energy", "✅"),
+        ("is well-mixed for electronic music", "🎵"),
+    )),
+})
+GENERAL_ENERGY_BANDS = ((-16, -12), (
+    ("needs more energy", "❌"),
+    ("has good energy", "✅"),
+    ("is well-mixed", "🎵"),
+))
+
+# Vibe keywords for each genre, checked in this order. Matched as whole words,
+# so "rapid" or "lively" no longer count as rap or live music.
+HIPHOP_KEYWORDS = frozenset({'hip', 'hiphop', 'rap', 'rapper', 'trap', 'drill', 'jay', 'kendrick', 'drake'})
+ELECTRONIC_KEYWORDS = frozenset({'edm', 'electronic', 'dance', 'house', 'techno', 'trance'})
+ROCK_KEYWORDS = frozenset({'rock', 'guitar', 'guitars', 'band', 'live'})
+POP_KEYWORDS = frozenset({'pop', 'mainstream', 'radio'})
+ACOUSTIC_KEYWORDS = frozenset({'acoustic', 'folk', 'singer', 'guitar'})
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Tempo (BPM) boundaries of the fallback genres used when the vibe doesn't name one
+TEMPO_THRESHOLDS = (90, 120, 140)
+
+def energy_assessment(genre, rms_db):
+    """(description, emoji) for a track's energy at ``rms_db`` in ``genre``"""
+    thresholds, verdicts = ENERGY_BANDS_BY_GENRE.get(genre, GENERAL_ENERGY_BANDS)
+    return verdicts[bisect_right(thresholds, rms_db)]
+
+
+def get_daw_plugins(daw):
+    """Get DAW-specific plugin recommendations"""
+    return DAW_PLUGINS.get(daw, DEFAULT_PLUGINS)
+
+
+def analyze_genre_characteristics(tempo, vibe, metrics):
+    """Analyze genre characteristics based on tempo, vibe, and metrics"""
+    # Only the tempo band matters, so equivalent inputs share one cache entry
+    genre_info = _genre_core(bisect_left(TEMPO_THRESHOLDS, tempo), vibe.lower().strip() if vibe else "")
+    # Hand out a copy so callers can't modify the cached entry
+    return dict(genre_info, characteristics=list(genre_info['characteristics']))
+
+
+@lru_cache(maxsize=256)
+def _genre_core(tempo_band, vibe_lower):
+    """Genre analysis for a tempo band (index into TEMPO_THRESHOLDS) and lowercased vibe"""
+    
+    # Default genre analysis
+    genre_info = {
+        'genre': 'Unknown',
+        'characteristics': [],
+        'loudness_target': -14,
+        'compression_style': 'moderate',
+        'eq_focus': 'balanced'
+    }
+    
+    # Analyze based on vibe keywords
+    vibe_words = frozenset(_WORD_RE.findall(vibe_lower))
+    
+    if HIPHOP_KEYWORDS & vibe_words:
+        genre_info.update({
+            'genre': 'Hip-Hop/Rap',
+            'characteristics': ['heavy bass', 'punchy drums', 'clear vocals', 'wide stereo'],
+            'loudness_target': -10,
+            'compression_style': 'aggressive',
+            'eq_focus': 'bass and presence'
+        })
+    elif ELECTRONIC_KEYWORDS & vibe_words:
+        genre_info.update({
+            'genre': 'Electronic/Dance',
+            'characteristics': ['punchy kick', 'wide stereo', 'bright highs', 'tight compression'],
+            'loudness_target': -8,
+            'compression_style': 'tight',
+            'eq_focus': 'kick and highs'
+        })
+    elif ROCK_KEYWORDS & vibe_words:
+        genre_info.update({
+            'genre': 'Rock',
+            'characteristics': ['guitar presence', 'punchy drums', 'vocal clarity', 'natural dynamics'],
+            'loudness_target': -12,
+            'compression_style': 'moderate',
+            'eq_focus': 'guitars and vocals'
+        })
+    elif POP_KEYWORDS & vibe_words:
+        genre_info.update({
+            'genre': 'Pop',
+            'characteristics': ['vocal forward', 'bright mix', 'wide stereo', 'consistent levels'],
+            'loudness_target': -10,
+            'compression_style': 'consistent',
+            'eq_focus': 'vocals and brightness'
+        })
+    elif ACOUSTIC_KEYWORDS & vibe_words:
+        genre_info.update({
+            'genre': 'Acoustic/Folk',
+            'characteristics': ['natural dynamics', 'warm tones', 'minimal processing', 'space'],
+            'loudness_target': -16,
+            'compression_style': 'gentle',
+            'eq_focus': 'warmth and clarity'
+        })
+    
+    # Override with tempo-based analysis if no vibe detected
+    if genre_info['genre'] == 'Unknown':
+        if tempo_band == 3:
+            genre_info.update({
+                'genre': 'Fast Electronic/Dance',
+                'characteristics': ['high energy', 'tight compression', 'bright mix'],
+                'loudness_target': -8,
+                'compression_style': 'tight',
+                'eq_focus': 'kick and highs'
+            })
+        elif tempo_band == 2:
+            genre_info.update({
+                'genre': 'Pop/Rock',
+                'characteristics': ['moderate energy', 'balanced mix', 'clear vocals'],
+                'loudness_target': -12,
+                'compression_style': 'moderate',
+                'eq_focus': 'balanced'
+            })
+        elif tempo_band == 1:
+            genre_info.update({
+                'genre': 'Hip-Hop/Rap',
+                'characteristics': ['punchy drums', 'heavy bass', 'clear vocals'],
+                'loudness_target': -10,
+                'compression_style': 'aggressive',
+                'eq_focus': 'bass and presence'
+            })
+        else:
+            genre_info.update({
+                'genre': 'Slow/Ambient',
+                'characteristics': ['atmospheric', 'gentle dynamics', 'warm tones'],
+                'loudness_target': -16,
+                'compression_style': 'gentle',
+                'eq_focus': 'warmth and space'
+            })
+    
+    # Pre-rendered bullet list for the feedback report, built once per cache entry
+    genre_info['characteristics_bullets'] = "\n".join(f"• {char}" for char in genre_info['characteristics'])
+    
+    return genre_info
@@ -5,7 +5,6 @@ Mixbot Streamlit App Launcher
 This script launches the Mixbot AI Mixing Assistant web application.
 """
 
-import subprocess
 import sys
 import os
 
@@ -47,16 +46,17 @@ def main():
     print("=" * 50)
     
     try:
-        # Launch Streamlit app
-        subprocess.run([
+        # Replace this process with Streamlit rather than waiting on it as a child;
+        # Ctrl+C then goes straight to Streamlit. exec discards Python's buffers,
+        # so flush the banner first
+        sys.stdout.flush()
+        os.execv(sys.executable, [
             sys.executable, "-m", "streamlit", "run", "app.py",
             "--server.port", "8501",
             "--server.address", "localhost",
             "--browser.gatherUsageStats", "false"
         ])
-    except KeyboardInterrupt:
-        print("\n👋 Mixbot stopped. Thanks for using the AI Mixing Assistant!")
-    except Exception as e:
+    except OSError as e:
         print(f"❌ Error launching app: {e}")
         print("   Make sure Streamlit is installed: pip install streamlit")
 
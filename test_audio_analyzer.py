@@ -5,6 +5,8 @@ Test script for audio_analyzer.py
 This script demonstrates how to use the audio analyzer functions programmatically.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from audio_analyzer import (
     calculate_duration,
@@ -15,17 +17,22 @@ from audio_analyzer import (
 )
 
 
-def create_test_audio(duration=5.0, sample_rate=22050):
+@lru_cache(maxsize=8)
+def create_test_audio(duration=5.0, sample_rate=22050, seed=0):
     """
     Create a test audio signal for demonstration.
     
     Args:
         duration: Duration in seconds
         sample_rate: Sample rate in Hz
+        seed: Seed for the added noise, so runs are reproducible
         
     Returns:
-        Tuple of (audio_data, sample_rate)
+        Tuple of (audio_data, sample_rate). The array is cached and shared
+        between calls, so it is read-only; copy it before modifying.
     """
+    rng = np.random.default_rng(seed)
+    
     # Create time array
     t = np.linspace(0, duration, int(sample_rate * duration), False)
     
@@ -39,9 +46,10 @@ def create_test_audio(duration=5.0, sample_rate=22050):
     audio[-silence_samples:] = 0
     
     # Add some noise to make it more realistic
-    noise = 0.01 * np.random.randn(len(audio))
+    noise = 0.01 * rng.standard_normal(len(audio))
     audio += noise
     
+    audio.flags.writeable = False
     return audio, sample_rate
 
 
@@ -88,14 +96,33 @@ def test_audio_analysis():
     print("Testing with artificially clipped audio:")
     
     # Create clipped audio
-    clipped_audio = audio.copy()
-    clipped_audio[clipped_audio > 0.9] = 0.9  # Clip at 0.9
-    clipped_audio[clipped_audio < -0.9] = -0.9
+    clipped_audio = np.clip(audio, -0.9, 0.9)  # Clip at 0.9
     
     is_clipped_clipped, peak_level_db_clipped, _ = detect_clipping(clipped_audio, sample_rate)
     print(f"   - Peak level: {peak_level_db_clipped:.2f} dB")
     print(f"   - Likely clipped: {'YES' if is_clipped_clipped else 'NO'}")
 
 
+def test_detect_silence_periods():
+    """Silence periods are reported with exact window-aligned boundaries."""
+    # 10 ms windows at 1 kHz: 10-sample windows every 5 samples
+    sample_rate = 1000
+    audio = np.full(2000, 0.5)
+    audio[:300] = 0        # leading silence
+    audio[1000:1300] = 0   # internal silence
+    audio[1500:1550] = 0   # internal gap shorter than min_silence_duration
+    audio[1700:] = 0       # trailing silence, running to the end of the signal
+    
+    assert detect_silence(audio, sample_rate) == [(0.0, 0.295), (1.0, 1.295), (1.7, 2.0)]
+    
+    # Signals no longer than one window have no windows to measure
+    assert detect_silence(np.zeros(5), sample_rate) == []
+    assert detect_silence(np.zeros(10), sample_rate) == []
+    
+    # All-silent and all-loud signals
+    assert detect_silence(np.zeros(2000), sample_rate) == [(0.0, 2.0)]
+    assert detect_silence(np.full(2000, 0.5), sample_rate) == []
+
+
 if __name__ == "__main__":
     test_audio_analysis() 
\ No newline at end of file
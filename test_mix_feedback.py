@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for mix_feedback.py
+
+Pins the genre keyword matching and the energy band boundaries.
+"""
+
+import pytest
+from mix_feedback import analyze_genre_characteristics, energy_assessment
+
+
+# 130 BPM falls back to 'Pop/Rock' when the vibe names no genre
+FALLBACK_TEMPO = 130
+
+
+@pytest.mark.parametrize("vibe, genre", [
+    # Keywords inside hyphenated or run-together vibes still match as words
+    ("lofi-house", "Electronic/Dance"),
+    ("hiphop", "Hip-Hop/Rap"),
+    ("Hip Hop", "Hip-Hop/Rap"),
+    ("trap-soul", "Hip-Hop/Rap"),
+    ("synth-pop", "Pop"),
+    ("acoustic guitar", "Rock"),
+    ("folk singer", "Acoustic/Folk"),
+    # Keywords that only occur inside longer words don't match
+    ("rapid fire", "Pop/Rock"),
+    ("lively", "Pop/Rock"),
+    ("popular", "Pop/Rock"),
+    ("whip", "Pop/Rock"),
+    ("", "Pop/Rock"),
+])
+def test_genre_keywords_match_whole_words(vibe, genre):
+    assert analyze_genre_characteristics(FALLBACK_TEMPO, vibe, {})['genre'] == genre
+
+
+# (genre, lower boundary, upper boundary) in RMS dB: quieter than the lower one
+# needs more energy, from the lower one up is good, from the upper one up is well-mixed
+ENERGY_BOUNDARIES = [
+    ('Hip-Hop/Rap', -15, -10),
+    ('Electronic/Dance', -12, -8),
+    ('Unknown', -16, -12),
+]
+
+
+@pytest.mark.parametrize("genre, rms_db, emoji", [
+    case
+    for genre, lower, upper in ENERGY_BOUNDARIES
+    for case in [
+        (genre, lower - 0.01, "❌"),
+        (genre, lower, "✅"),
+        (genre, upper - 0.01, "✅"),
+        (genre, upper, "🎵"),
+    ]
+])
+def test_energy_band_boundaries(genre, rms_db, emoji):
+    assert energy_assessment(genre, rms_db)[1] == emoji